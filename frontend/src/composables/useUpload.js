@@ -2,6 +2,13 @@ import { ref } from 'vue'
 import { useAppStore } from '../stores/app'
 import { apiCall, getApiUrl } from '../services/api'
 
+// Single files above this size are sent as a raw body (no multipart encoding)
+const RAW_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+// Raw uploads are sent in chunks of this size, so a dropped connection only
+// resends the current chunk
+const RAW_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+const RAW_UPLOAD_RETRIES = 3
+
 export function useUpload() {
   const appStore = useAppStore()
 
@@ -90,15 +97,20 @@ export function useUpload() {
 
   /**
    * Upload files using XMLHttpRequest for progress tracking
+   * @param {FormData|File} body - Multipart form, or a single file for the raw endpoint
+   * @param {string} endpoint - Upload API path
+   * @param {Object} headers - Extra request headers
+   * @param {number} progressOffset - Bytes already sent by earlier requests
+   * @param {number} progressTotal - Total bytes of the whole upload (default: this request)
    */
-  function uploadWithProgress(formData) {
+  function uploadWithProgress(body, endpoint = '/api/upload', headers = {}, progressOffset = 0, progressTotal = null) {
     return new Promise((resolve, reject) => {
       const xhr = new XMLHttpRequest()
 
       // Track upload progress
       xhr.upload.addEventListener('progress', (e) => {
         if (e.lengthComputable) {
-          updateProgress(e.loaded, e.total)
+          updateProgress(progressOffset + e.loaded, progressTotal || e.total)
         }
       })
 
@@ -112,28 +124,37 @@ export function useUpload() {
         } else {
           // Try to parse error message from response
           let errorMsg = xhr.statusText
+          let errorData = {}
           try {
-            const errorData = JSON.parse(xhr.responseText)
+            errorData = JSON.parse(xhr.responseText)
             if (errorData.error) {
               errorMsg = errorData.error
             }
           } catch (e) {
             // Keep default error message
           }
-          reject(new Error('Upload failed: ' + errorMsg))
+          const err = new Error('Upload failed: ' + errorMsg)
+          err.status = xhr.status
+          err.response = errorData
+          reject(err)
         }
       })
 
       xhr.addEventListener('error', () => {
-        reject(new Error('Network error during upload'))
+        const err = new Error('Network error during upload')
+        err.network = true
+        reject(err)
       })
 
       xhr.addEventListener('abort', () => {
         reject(new Error('Upload canceled'))
       })
 
-      xhr.open('POST', getApiUrl('/api/upload'))
+      xhr.open('POST', getApiUrl(endpoint))
       xhr.setRequestHeader('Authorization', `token ${appStore.authToken}`)
+      for (const [name, value] of Object.entries(headers)) {
+        xhr.setRequestHeader(name, value)
+      }
 
       // Wire up abort controller
       if (abortController) {
@@ -142,10 +163,114 @@ export function useUpload() {
         })
       }
 
-      xhr.send(formData)
+      xhr.send(body)
     })
   }
 
+  /**
+   * Upload a single file to the raw endpoint in resumable chunks
+   * After a network error the upload continues from the offset the server reports.
+   * If the upload is canceled or fails, the server's partial file is discarded.
+   * @param {File} file - File to upload
+   * @param {Object} headers - Raw upload headers (file name, destination, job ID)
+   */
+  async function uploadResumable(file, headers) {
+    try {
+      return await sendChunks(file, headers)
+    } catch (error) {
+      try {
+        await fetch(getApiUrl('/api/upload/raw'), {
+          method: 'DELETE',
+          headers: {
+            ...headers,
+            'Authorization': `token ${appStore.authToken}`
+          }
+        })
+      } catch (e) {
+        console.error('Failed to discard partial upload:', e)
+      }
+      throw error
+    }
+  }
+
+  /**
+   * Send the chunks of a resumable raw upload, retrying failed chunks
+   * @param {File} file - File to upload
+   * @param {Object} headers - Raw upload headers (file name, destination, job ID)
+   */
+  async function sendChunks(file, headers) {
+    let offset = 0
+    let retries = 0
+    while (true) {
+      const end = Math.min(offset + RAW_UPLOAD_CHUNK_SIZE, file.size)
+      let result
+      try {
+        result = await uploadWithProgress(file.slice(offset, end), '/api/upload/raw', {
+          ...headers,
+          'X-Upload-Offset': String(offset),
+          'X-Upload-Length': String(file.size)
+        }, offset, file.size)
+      } catch (error) {
+        const canRetry = error.network || (error.status === 409 && error.response.offset !== undefined)
+        if (!canRetry || retries >= RAW_UPLOAD_RETRIES) {
+          throw error
+        }
+        retries++
+        if (error.status === 409) {
+          // Server has a different number of bytes: continue from there
+          offset = error.response.offset
+        }
+        continue
+      }
+
+      if (result.files) {
+        return result
+      }
+      offset = result.offset
+      retries = 0
+    }
+  }
+
+  /**
+   * Upload files, sending a single large file as a raw body
+   * @param {Array} files - Files (or {file, path} objects when hasDirectories)
+   * @param {Object} fields - job_id, destination and optional direct_upload
+   * @param {boolean} hasDirectories - Whether files carry relative paths
+   */
+  function uploadFiles(files, fields, hasDirectories) {
+    if (!hasDirectories && files.length === 1 && files[0].size > RAW_UPLOAD_THRESHOLD) {
+      const file = files[0]
+      return uploadResumable(file, {
+        'Content-Type': 'application/octet-stream',
+        'X-Filename': encodeURIComponent(file.name),
+        'X-Destination': encodeURIComponent(fields.destination),
+        'X-Job-Id': fields.job_id,
+        'X-Direct-Upload': fields.direct_upload || 'false'
+      })
+    }
+
+    const formData = new FormData()
+
+    // Handle both formats: array of Files or array of {file, path} objects
+    if (hasDirectories) {
+      for (const item of files) {
+        formData.append('files[]', item.file)
+        formData.append('paths[]', item.path)
+      }
+    } else {
+      for (const file of files) {
+        formData.append('files[]', file)
+      }
+    }
+
+    for (const [name, value] of Object.entries(fields)) {
+      formData.append(name, value)
+    }
+    formData.append('has_directories', hasDirectories ? 'true' : 'false')
+
+    return uploadWithProgress(formData)
+  }
+
   /**
    * Handle upload directly to local filesystem
    */
@@ -160,26 +285,11 @@ export function useUpload() {
     startTime = Date.now()
 
     try {
-      const formData = new FormData()
-
-      // Handle both formats: array of Files or array of {file, path} objects
-      if (hasDirectories) {
-        for (const item of files) {
-          formData.append('files[]', item.file)
-          formData.append('paths[]', item.path)
-        }
-      } else {
-        for (const file of files) {
-          formData.append('files[]', file)
-        }
-      }
-
-      formData.append('job_id', 'direct-' + Date.now())
-      formData.append('destination', targetPath)
-      formData.append('direct_upload', 'true')
-      formData.append('has_directories', hasDirectories ? 'true' : 'false')
-
-      const uploadData = await uploadWithProgress(formData)
+      const uploadData = await uploadFiles(files, {
+        job_id: 'direct-' + Date.now(),
+        destination: targetPath,
+        direct_upload: 'true'
+      }, hasDirectories)
 
       // Update progress message
       uploadMessage.value = 'Upload complete!'
@@ -224,26 +334,10 @@ export function useUpload() {
 
     try {
       // Step 1: Upload files to cache
-      const formData = new FormData()
-
-      if (hasDirectories) {
-        for (const item of files) {
-          formData.append('files[]', item.file)
-          formData.append('paths[]', item.path)
-        }
-      } else {
-        for (const file of files) {
-          formData.append('files[]', file)
-        }
-      }
-
-      formData.append('job_id', jobId)
-      formData.append('has_directories', hasDirectories ? 'true' : 'false')
-
-      const destPath = `${targetRemote}:${targetPath}`
-      formData.append('destination', destPath)
-
-      const uploadData = await uploadWithProgress(formData)
+      const uploadData = await uploadFiles(files, {
+        job_id: jobId,
+        destination: `${targetRemote}:${targetPath}`
+      }, hasDirectories)
 
       // Update progress message
       uploadMessage.value = 'Upload complete! Starting transfer to destination...'
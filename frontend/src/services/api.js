@@ -50,6 +50,21 @@ export function getApiUrl(path) {
     return path;
 }
 
+/**
+ * Start a browser download from an authenticated API URL
+ * The browser writes the response straight to disk instead of buffering a blob
+ * @param {string} path - API path of the download
+ * @param {string} filename - Suggested file name
+ */
+export function downloadFromApi(path, filename = '') {
+    const a = document.createElement('a');
+    a.href = `${getApiUrl(path)}?token=${encodeURIComponent(authToken)}`;
+    a.download = filename;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+}
+
 /**
  * Make an authenticated API call
  * @param {string} endpoint - API endpoint path
@@ -2,13 +2,31 @@
 File operations API endpoints
 Handles ls, mkdir, delete, download operations
 """
+import hmac
+import io
 import logging
 import os
-import shutil
+import re
 import secrets
-from flask import Blueprint, request, jsonify, send_file, current_app, after_this_request
-
-from ..auth import token_required
+import stat
+import threading
+import time
+import zipfile
+from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import quote
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from flask import Blueprint, Response, request, jsonify, send_file, current_app
+
+from ..auth import token_required, verify_token
+from ..cache import TTLCache, fingerprint
+from ..config import format_size
+from ..json_utils import json_response, parse_request_json, request_json
 from ..rclone.wrapper import RcloneWrapper
 from ..rclone.exceptions import RcloneException
 from ..models import Database
@@ -19,6 +37,57 @@ files_bp = Blueprint('files', __name__)
 rclone = None
 db = None
 
+# 'remote:...' prefix (names as accepted by validate_remote_name); 'C:' style drives are local
+_REMOTE_PATH_RE = re.compile(r'^(?![A-Za-z]:)[A-Za-z0-9_\-.+@ ]+:')
+
+# Home directory of the user running Motus (resolved once)
+_HOME = os.path.expanduser('~')
+
+# Request body schemas (field -> (type, required)) for parse_request_json
+_PATH_REQUEST = {'path': (str, True), 'remote_config': (dict, False)}
+_PATHS_REQUEST = {'paths': (list, True), 'remote_config': (dict, False)}
+
+# Remote directory listings keyed by (path, remote_config fingerprint)
+_ls_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Directory sizes keyed by (local path, root mtime) or (remote path, remote_config
+# fingerprint); entries also die when a transfer job starts or finishes
+_size_cache = TTLCache(maxsize=1024, ttl=300)
+
+# Shared pool for per-path size calculations (remote sizes are full recursive listings)
+_size_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='motus-size')
+SIZE_TIMEOUT = 600  # seconds to wait for a single path's size
+
+
+def _default_scan_workers() -> int:
+    """
+    Number of threads for local directory scans
+
+    Two per CPU, between 8 and 32: scans mostly wait on the kernel or a
+    network filesystem rather than the CPU. Each in-flight scan holds a
+    directory descriptor, so the count also stays well below the open-file
+    limit.
+    """
+    workers = min(32, max(8, (os.cpu_count() or 1) * 2))
+    if resource is not None:
+        soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        if soft_limit != resource.RLIM_INFINITY:
+            workers = min(workers, soft_limit // 16)
+    return max(2, workers)
+
+
+# Directory scans for local size walks; separate pool so size workers can wait on it
+SCAN_WORKERS = _default_scan_workers()
+_scan_executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix='motus-scan')
+SCAN_BATCH = 64  # directories scanned per task before handing the rest back
+
+# Delay before removing a zip handed to the reverse proxy (it opens the file right away)
+ACCEL_CLEANUP_DELAY = 60
+
+# Pending streamed ZIP downloads: stream token -> {'paths', 'remote_config', 'filename'}
+_zip_streams = TTLCache(maxsize=256, ttl=300)
+STREAM_CHUNK_SIZE = 256 * 1024
+
 
 def init_files(rclone_instance: RcloneWrapper, db_instance: Database):
     """Initialize rclone wrapper and database"""
@@ -27,16 +96,121 @@ def init_files(rclone_instance: RcloneWrapper, db_instance: Database):
     db = db_instance
 
 
-def safe_remove(path):
+def _normalize_listing_path(path: str) -> str:
+    """Strip trailing slashes so 'remote:/a/' and 'remote:/a' share cache entries"""
+    return path.rstrip('/')
+
+
+def _cached_ls(path: str, remote_config: dict = None) -> list:
+    """
+    List a path, serving remote listings from a short-lived cache
+
+    Local paths are always listed fresh. Cached remote listings are discarded
+    as soon as any transfer job starts or finishes, since it may have changed
+    the listed directory.
+
+    Args:
+        path: Path to list (supports remote:path syntax)
+        remote_config: Optional remote configuration
+
+    Returns:
+        List of file dicts as returned by rclone.ls
+    """
+    if not is_remote_path(path):
+        return rclone.ls(path, remote_config)
+
+    key = (_normalize_listing_path(path), fingerprint(remote_config))
+    generation = rclone.job_generation()
+    cached = _ls_cache.get(key)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    files = rclone.ls(path, remote_config)
+    _ls_cache.set(key, (generation, files))
+    return files
+
+
+def _has_cached_ls(path: str, remote_config: dict = None) -> bool:
+    """Check whether _cached_ls(path) would be served without listing"""
+    cached = _ls_cache.get((_normalize_listing_path(path), fingerprint(remote_config)))
+    return cached is not None and cached[0] == rclone.job_generation()
+
+
+def _split_listing_path(path: str) -> tuple:
+    """
+    Split a path into its parent listing path and entry name
+
+    Examples:
+        'remote:/a/b/' -> ('remote:/a', 'b')
+        'remote:/a'    -> ('remote:', 'a')
+    """
+    target = _normalize_listing_path(path)
+    if '/' in target:
+        return tuple(target.rsplit('/', 1))
+    if ':' in target:
+        remote, name = target.split(':', 1)
+        return remote + ':', name
+    return '', target
+
+
+def _invalidate_ls(path: str):
+    """
+    Drop cached listings affected by a change to path
+
+    Removes the entries for the path itself, its parent and anything below it.
+    """
+    target = _normalize_listing_path(path)
+    parent = _split_listing_path(path)[0]
+
+    def affected(key):
+        cached_path = key[0]
+        return (cached_path == target or cached_path == parent
+                or cached_path.startswith(target + '/'))
+
+    _ls_cache.invalidate(affected)
+    _invalidate_sizes(path)
+
+
+def _invalidate_sizes(path: str):
+    """
+    Drop cached directory sizes affected by a change to path
+
+    Removes the entries for the path itself, anything below it and every
+    ancestor (whose total includes it), for both the given and resolved local path.
+    """
+    targets = {_normalize_listing_path(path)}
+    local_path = rclone.resolve_to_local_path(path)
+    if local_path is not None:
+        targets.add(_normalize_listing_path(local_path))
+
+    def affected(key):
+        cached_path = key[0]
+        for target in targets:
+            if (cached_path == target or cached_path.startswith(target + '/')
+                    or target.startswith(cached_path + '/')
+                    or (cached_path.endswith(':') and target.startswith(cached_path))):
+                return True
+        return False
+
+    _size_cache.invalidate(affected)
+
+
+def _cached_size(key, compute) -> int:
     """
-    Safely remove a file or directory
+    Return a directory size from _size_cache, computing and storing it on a miss
 
-    Handles both files and directories (recursively)
+    Args:
+        key: Cache key; the first element must be the (normalized) path
+        compute: Callable returning the size in bytes
     """
-    if os.path.isdir(path):
-        shutil.rmtree(path)
-    else:
-        os.remove(path)
+    generation = rclone.job_generation()
+    cached = _size_cache.get(key)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    size = compute()
+    _size_cache.set(key, (generation, size))
+    return size
 
 
 @files_bp.route('/api/files/ls', methods=['POST'])
@@ -71,18 +245,19 @@ def list_files():
     }
     """
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
         remote_config = data.get('remote_config')
 
         logging.info(f"Listing files at {path}")
 
-        files = rclone.ls(path, remote_config)
+        files = _cached_ls(path, remote_config)
 
-        return jsonify({
+        # Listings can hold thousands of entries; encode them with the fast encoder
+        return json_response({
             'files': files,
             'path': path,
         })
@@ -117,9 +292,9 @@ def make_directory():
     }
     """
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
         remote_config = data.get('remote_config')
@@ -127,6 +302,7 @@ def make_directory():
         logging.info(f"Creating directory {path}")
 
         rclone.mkdir(path, remote_config)
+        _invalidate_ls(path)
 
         return jsonify({
             'message': 'Directory created successfully',
@@ -163,9 +339,9 @@ def delete_file():
     }
     """
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
         remote_config = data.get('remote_config')
@@ -173,6 +349,7 @@ def delete_file():
         logging.info(f"Deleting {path}")
 
         rclone.delete(path, remote_config)
+        _invalidate_ls(path)
 
         return jsonify({
             'message': 'Deleted successfully',
@@ -203,21 +380,27 @@ def expand_home():
         "expanded_path": "/home/username/Documents"
     }
     """
-    import os
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
 
-        # Use os.path.expanduser which is cross-platform
-        expanded = os.path.expanduser(path)
+        # The current user's home never changes while running, so skip the
+        # environment/passwd lookup for the common '~' and '~/...' forms
+        if path == '~':
+            expanded = _HOME
+        elif path.startswith('~/') or path.startswith('~' + os.sep):
+            expanded = _HOME + path[1:]
+        else:
+            # '~otheruser/...' and plain paths (cross-platform)
+            expanded = os.path.expanduser(path)
 
-        # Remove trailing slash (except for root '/') for consistency
+        # Remove trailing slashes (except for root '/') for consistency
         # Works on Unix, Mac, and Windows (handles both '/' and '\')
         if len(expanded) > 1:
-            expanded = expanded.rstrip('/').rstrip('\\')
+            expanded = expanded.rstrip('/\\') or expanded[0]
 
         logging.info(f"Expanded path: {path} -> {expanded}")
 
@@ -230,6 +413,65 @@ def expand_home():
         return jsonify({'error': str(e)}), 500
 
 
+def _scan_directories(stack: list, budget: int = SCAN_BATCH):
+    """
+    Sum file sizes while walking a local directory stack depth-first
+
+    Directory entries come with their type, so the only syscall per file is
+    the stat for its size (cached by DirEntry, so a symlink's target is only
+    stat'ed once). Directory symlinks are not followed (same as os.walk), and
+    special files (FIFOs, sockets, devices) are not counted since they are
+    never archived.
+
+    Args:
+        stack: Directories still to scan (consumed)
+        budget: Maximum number of directories to scan in this call
+
+    Returns:
+        (size in bytes, directories left unscanned)
+    """
+    size = 0
+    while stack and budget > 0:
+        budget -= 1
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            size += entry.stat().st_size
+                    except OSError:
+                        pass  # Skip files we can't read
+        except OSError:
+            pass  # Skip directories we can't read
+    return size, stack
+
+
+def _local_tree_size(root: str) -> int:
+    """
+    Sum file sizes below a local directory
+
+    Subtrees are scanned concurrently in batches of directories: getdents and
+    stat release the GIL, so several scans in flight hide per-syscall latency
+    on cold caches and network filesystems.
+    """
+    total_size, pending_dirs = _scan_directories([root])
+    in_flight = set()
+    while pending_dirs or in_flight:
+        # Split the remaining directories between idle workers
+        while pending_dirs and len(in_flight) < SCAN_WORKERS:
+            share = max(1, len(pending_dirs) // (SCAN_WORKERS - len(in_flight)))
+            batch, pending_dirs = pending_dirs[-share:], pending_dirs[:-share]
+            in_flight.add(_scan_executor.submit(_scan_directories, batch))
+        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            size, remaining = future.result()
+            total_size += size
+            pending_dirs.extend(remaining)
+    return total_size
+
+
 def calculate_path_size(path: str, remote_config: dict = None) -> int:
     """
     Calculate total size of a file or directory
@@ -246,31 +488,64 @@ def calculate_path_size(path: str, remote_config: dict = None) -> int:
         local_path = rclone.resolve_to_local_path(path)
 
         if local_path is not None:
-            # It's a local path - use os.path for efficiency
-            if os.path.isfile(local_path):
-                return os.path.getsize(local_path)
-            elif os.path.isdir(local_path):
-                # Calculate directory size
-                total_size = 0
-                for dirpath, dirnames, filenames in os.walk(local_path):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        try:
-                            total_size += os.path.getsize(filepath)
-                        except OSError:
-                            pass  # Skip files we can't read
-                return total_size
-            else:
+            # It's a local path - a single stat tells file from directory
+            try:
+                st = os.stat(local_path)
+            except OSError:
                 return 0
+            if stat.S_ISDIR(st.st_mode):
+                # Repeated downloads of the same folder reuse the walk while
+                # the folder's own entries are unchanged
+                key = (_normalize_listing_path(local_path), st.st_mtime_ns)
+                return _cached_size(key, lambda: _local_tree_size(local_path))
+            return st.st_size
 
         # Remote path - use rclone size command to get accurate size
-        result = rclone.size(path, remote_config)
-        return result.get('bytes', 0)
+        key = (_normalize_listing_path(path), fingerprint(remote_config))
+        return _cached_size(key, lambda: rclone.size(path, remote_config).get('bytes', 0))
     except Exception as e:
         logging.warning(f"Could not calculate size for {path}: {e}")
         return 0
 
 
+def _listed_file_sizes(paths: list, remote_config: dict = None) -> dict:
+    """
+    Look up sizes of remote files in their parent directory listings
+
+    Selections usually come from a directory the client has just listed, so
+    one (typically cached) listing covers every selected file in it instead
+    of one size call per file. A parent is only listed for a single path if
+    its listing is already cached.
+
+    Args:
+        paths: List of paths
+        remote_config: Optional remote configuration
+
+    Returns:
+        dict mapping each path found to be a remote file to its size
+    """
+    groups = {}
+    for path in paths:
+        if is_remote_path(path):
+            parent, name = _split_listing_path(path)
+            groups.setdefault(parent, []).append((path, name))
+
+    sizes = {}
+    for parent, members in groups.items():
+        if len(members) < 2 and not _has_cached_ls(parent, remote_config):
+            continue
+        try:
+            items = {item['Name']: item for item in _cached_ls(parent, remote_config)}
+        except Exception as e:
+            logging.debug(f"Could not list {parent} for sizes: {e}")
+            continue
+        for path, name in members:
+            item = items.get(name)
+            if item is not None and not item.get('IsDir', False):
+                sizes[path] = max(item.get('Size', 0), 0)
+    return sizes
+
+
 def calculate_total_size(paths: list, remote_config: dict = None) -> int:
     """
     Calculate total size of multiple paths
@@ -282,9 +557,22 @@ def calculate_total_size(paths: list, remote_config: dict = None) -> int:
     Returns:
         int: Total size in bytes
     """
-    total = 0
-    for path in paths:
-        total += calculate_path_size(path, remote_config)
+    # Remote files are answered by their parent's listing; only the rest
+    # (folders and local paths) need an individual size calculation
+    listed_sizes = _listed_file_sizes(paths, remote_config)
+    total = sum(listed_sizes.values())
+    paths = [path for path in paths if path not in listed_sizes]
+
+    if len(paths) <= 1:
+        return total + sum(calculate_path_size(path, remote_config) for path in paths)
+
+    # Sizes are independent and network-bound, so compute them in parallel
+    futures = [_size_executor.submit(calculate_path_size, path, remote_config) for path in paths]
+    for path, future in zip(paths, futures):
+        try:
+            total += future.result(timeout=SIZE_TIMEOUT)
+        except Exception as e:
+            logging.warning(f"Could not calculate size for {path}: {e}")
     return total
 
 
@@ -301,6 +589,10 @@ def is_remote_path(path: str) -> bool:
     Returns:
         True if the path resolves to a remote, False if it's local
     """
+    # Plain local paths can't be remote - skip reloading the rclone config
+    if not _REMOTE_PATH_RE.match(path):
+        return False
+
     # Try to resolve to local path using alias chain resolution
     local_path = rclone.resolve_to_local_path(path)
 
@@ -309,38 +601,209 @@ def is_remote_path(path: str) -> bool:
     return local_path is None
 
 
-def is_single_file(path: str, remote_config: dict = None) -> bool:
-    """Check if path is a single file (not a directory)"""
+def stat_download_path(path: str, remote_config: dict = None):
+    """
+    Get type and size of a single path with one metadata lookup
+
+    Args:
+        path: Local or remote path
+        remote_config: Optional remote configuration
+
+    Returns:
+        dict with 'IsDir' and 'Size', or None if the path could not be stat'ed
+    """
     try:
         # Try to resolve to local path first
         local_path = rclone.resolve_to_local_path(path)
 
         if local_path is not None:
-            # It's a local path (or resolves to one) - use os.path directly
-            return os.path.isfile(local_path)
+            # It's a local path (or resolves to one) - use os.stat directly
+            st = os.stat(local_path)
+            is_dir = stat.S_ISDIR(st.st_mode)
+            return {'IsDir': is_dir, 'Size': 0 if is_dir else st.st_size}
+
+        # For remote paths, stat the path itself (no parent listing needed)
+        item = rclone.stat(path, remote_config)
+        if item is None:
+            return None
+        is_dir = item.get('IsDir', False)
+        return {'IsDir': is_dir, 'Size': 0 if is_dir else max(item.get('Size', 0), 0)}
+    except Exception as e:
+        logging.warning(f"Could not stat {path}: {e}")
+        return None
 
-        # For remote paths, try to list it
-        # If it's a file, rclone will fail or return empty list
-        # If it's a directory, rclone will return contents
-        files = rclone.ls(path, remote_config)
 
-        # If ls returns empty or fails, might be a file
-        # Check parent directory
-        if is_remote_path(path):
-            parts = path.rsplit('/', 1)
-            if len(parts) == 2:
-                parent_path, filename = parts
-                parent_files = rclone.ls(parent_path, remote_config)
-                for item in parent_files:
-                    if item.get('Name') == filename and not item.get('IsDir', False):
-                        return True
-
-        # If we got here and files is not empty, it's a directory
-        return False
-    except Exception as e:
-        logging.warning(f"Could not determine if {path} is file: {e}")
-        # Default to false (assume directory) to be safe
-        return False
+class _ZipStreamBuffer(io.RawIOBase):
+    """Write-only, non-seekable sink collecting ZIP output for a streamed response"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        """Return and clear everything written so far"""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _read_local_file(file_path: str):
+    """Yield the contents of a local file in chunks"""
+    with open(file_path, 'rb') as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _walk_local_files(root: str):
+    """
+    Yield paths of the regular files below a local directory
+
+    Uses os.scandir entry types, so no stat is needed per entry. Directory
+    symlinks are not followed (same as os.walk). Special files are skipped
+    because opening a FIFO would block the stream.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        pass  # Skip entries we can't read
+        except OSError:
+            pass  # Skip directories we can't read
+
+
+def _read_remote_file(path: str, remote_config: dict = None):
+    """Yield the contents of a remote file in chunks"""
+    return rclone.read_chunks(path, remote_config, STREAM_CHUNK_SIZE)
+
+
+def _zip_date_time(timestamp: float = None) -> tuple:
+    """ZIP entry date_time for a POSIX timestamp (now if None), clamped to 1980+"""
+    date_time = time.localtime(timestamp)[:6]
+    return max(date_time, (1980, 1, 1, 0, 0, 0))
+
+
+def _remote_zip_date_time(mod_time: str) -> tuple:
+    """
+    ZIP entry date_time for an rclone ModTime string
+
+    rclone reports nanosecond precision (e.g. 2024-01-01T10:00:00.123456789Z),
+    which datetime.fromisoformat() can't parse, so the fraction is dropped.
+    Falls back to the current time if the value is missing or malformed.
+    """
+    if mod_time:
+        try:
+            value = re.sub(r'\.\d+', '', mod_time, count=1).replace('Z', '+00:00')
+            return _zip_date_time(datetime.fromisoformat(value).timestamp())
+        except (ValueError, OverflowError, OSError):
+            logging.debug(f"Unparseable ModTime in zip stream: {mod_time}")
+    return _zip_date_time()
+
+
+def _zip_entries(paths: list, remote_config: dict = None):
+    """
+    Enumerate the files to put in a download ZIP
+
+    Uses the same archive layout as the background zip job: files at the top
+    level, directories under their own name.
+
+    Yields:
+        Tuples of (arcname, ZIP date_time, callable returning a chunk iterator)
+    """
+    for idx, path in enumerate(paths):
+        local_path = rclone.resolve_to_local_path(path)
+
+        if local_path is not None:
+            if os.path.isdir(local_path):
+                parent = os.path.dirname(local_path.rstrip('/'))
+                files = ((os.path.relpath(p, parent), p) for p in _walk_local_files(local_path))
+            elif os.path.isfile(local_path):
+                files = [(os.path.basename(local_path), local_path)]
+            else:
+                continue
+            for arcname, file_path in files:
+                try:
+                    mtime = os.stat(file_path).st_mtime
+                except OSError as e:
+                    logging.warning(f"Skipping {file_path} in zip stream: {e}")
+                    continue
+                yield arcname, _zip_date_time(mtime), lambda p=file_path: _read_local_file(p)
+            continue
+
+        base_name = path.rstrip('/').rsplit('/', 1)[-1].split(':')[-1]
+        item = rclone.stat(path, remote_config, mod_time=True)
+        if item is None:
+            logging.warning(f"Skipping missing path in zip stream: {path}")
+        elif not item.get('IsDir', False):
+            yield (base_name or f"file_{idx}", _remote_zip_date_time(item.get('ModTime')),
+                   lambda p=path: _read_remote_file(p, remote_config))
+        else:
+            for entry in rclone.list_files_recursive(path, remote_config):
+                file_path = f"{path.rstrip('/')}/{entry['Path']}"
+                yield (f"{base_name or 'folder'}/{entry['Path']}",
+                       _remote_zip_date_time(entry.get('ModTime')),
+                       lambda p=file_path: _read_remote_file(p, remote_config))
+
+
+def _generate_zip_stream(paths: list, remote_config: dict = None):
+    """
+    Build a ZIP of paths on the fly, yielding it chunk by chunk
+
+    Files that cannot be opened or fail before their first chunk are logged
+    and skipped. A read error later in a file aborts the stream, so the
+    client sees a failed download instead of a ZIP with a truncated entry.
+    """
+    sink = _ZipStreamBuffer()
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for arcname, date_time, open_chunks in _zip_entries(paths, remote_config):
+            chunks = None
+            try:
+                # Read ahead one chunk so unreadable files are skipped before
+                # their entry is started
+                try:
+                    chunks = open_chunks()
+                    first = next(chunks, None)
+                except Exception as e:
+                    logging.error(f"Skipping {arcname} in zip stream: {e}")
+                    continue
+
+                zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                try:
+                    with zf.open(zinfo, 'w', force_zip64=True) as entry:
+                        if first is not None:
+                            entry.write(first)
+                        for chunk in chunks:
+                            entry.write(chunk)
+                            data = sink.take()
+                            if data:
+                                yield data
+                except Exception as e:
+                    logging.error(f"Error adding {arcname} to zip stream, aborting download: {e}")
+                    raise
+            finally:
+                if chunks is not None:
+                    chunks.close()
+            data = sink.take()
+            if data:
+                yield data
+    yield sink.take()
 
 
 @files_bp.route('/api/files/download/prepare', methods=['POST'])
@@ -361,43 +824,65 @@ def prepare_download():
         "path": "/path/to/file"
     }
 
+    Response (streamed zip, when stream_zip_downloads is enabled):
+    {
+        "type": "zip_stream",
+        "url": "/api/files/download/stream/<stream_token>",
+        "filename": "folder.zip",
+        "estimated_size": 1048576
+    }
+
     Response (needs zip):
     {
         "type": "zip_job",
         "job_id": 123,
+        "download_token": "...",  // valid at /api/files/download/zip/<token> once the job completes
         "estimated_size": 1048576
     }
+
+    estimated_size is null unless the size had to be computed (single file or
+    max_download_size enforced).
     """
     try:
-        data = request.get_json()
-        if not data or 'paths' not in data:
-            return jsonify({'error': 'Missing required field: paths'}), 400
+        data, error = parse_request_json(_PATHS_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         paths = data['paths']
-        if not paths or not isinstance(paths, list):
+        n = len(paths)
+        if not n:
             return jsonify({'error': 'paths must be a non-empty list'}), 400
 
         remote_config = data.get('remote_config')
         config = current_app.motus_config
 
-        # Calculate total size
-        logging.info(f"Calculating size for {len(paths)} paths...")
-        total_size = calculate_total_size(paths, remote_config)
-        logging.info(f"Total size: {total_size} bytes")
+        # Only a single small file is served directly; anything else is zipped.
+        # Decide with one stat and only walk directories when a size limit
+        # actually has to be enforced.
+        info = None
+        total_size = None
+        if n == 1:
+            info = stat_download_path(paths[0], remote_config)
+            if info is not None and not info['IsDir']:
+                total_size = info['Size']
+
+        size_limited = config.max_download_size > 0
+        if total_size is None and size_limited:
+            logging.info(f"Calculating size for {n} paths...")
+            total_size = calculate_total_size(paths, remote_config)
+            logging.info(f"Total size: {total_size} bytes")
 
         # Check max download size limit
-        if config.max_download_size > 0 and total_size > config.max_download_size:
-            from ..config import format_size
+        if size_limited and total_size > config.max_download_size:
             logging.warning(f"Download rejected: size {total_size} exceeds limit {config.max_download_size}")
             return jsonify({
                 'error': f'Download size ({format_size(total_size)}) exceeds maximum allowed size ({format_size(config.max_download_size)})'
             }), 400
 
         # Check if we can do direct download
-        # Only for single file AND size < threshold
-        if (len(paths) == 1 and
-            is_single_file(paths[0], remote_config) and
-            total_size < config.max_uncompressed_download_size):
+        # Only for single file AND size < threshold (info is only set when n == 1)
+        if (info is not None and not info['IsDir'] and
+                total_size < config.max_uncompressed_download_size):
 
             logging.info(f"Direct download for {paths[0]}")
             return jsonify({
@@ -406,13 +891,41 @@ def prepare_download():
                 'size': total_size
             })
 
+        if config.stream_zip_downloads:
+            # Build the zip while it is downloaded (nothing staged on disk)
+            stream_token = secrets.token_urlsafe(32)
+            if n == 1:
+                base_name = paths[0].rstrip('/').rsplit('/', 1)[-1].split(':')[-1]
+                filename = f"{base_name or 'download'}.zip"
+            else:
+                filename = 'download.zip'
+            _zip_streams.set(stream_token, {
+                'paths': paths,
+                'remote_config': remote_config,
+                'filename': filename,
+            })
+            logging.info(f"Streaming zip for {n} paths")
+            return jsonify({
+                'type': 'zip_stream',
+                'url': f'/api/files/download/stream/{stream_token}',
+                'filename': filename,
+                'estimated_size': total_size
+            })
+
         # Need to create zip job
-        logging.info(f"Creating zip job for {len(paths)} paths (total size: {total_size} bytes)")
-        job_id = rclone.create_download_zip_job(paths, remote_config, total_size, db)
+        logging.info(f"Creating zip job for {n} paths")
+        download_token = secrets.token_urlsafe(32)
+        job_id = rclone.create_download_zip_job(
+            paths, remote_config, total_size, db,
+            transfers=config.download_transfers,
+            checkers=config.download_checkers,
+            download_token=download_token
+        )
 
         return jsonify({
             'type': 'zip_job',
             'job_id': job_id,
+            'download_token': download_token,
             'estimated_size': total_size
         })
 
@@ -443,9 +956,9 @@ def can_preview():
     }
     """
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
         config = current_app.motus_config
@@ -512,7 +1025,7 @@ def preview_file():
             auth_header = request.headers.get('Authorization', '')
             if auth_header.startswith('token '):
                 token = auth_header[6:]
-            data = request.get_json()
+            data = request_json()
             path = data.get('path') if data else None
         else:
             # Form request - token in form data
@@ -523,7 +1036,6 @@ def preview_file():
             return jsonify({'error': 'Missing authentication token'}), 401
 
         # Verify token
-        from ..auth import verify_token
         if not verify_token(token):
             return jsonify({'error': 'Invalid token'}), 401
 
@@ -538,15 +1050,16 @@ def preview_file():
         if local_path is None:
             return jsonify({'error': 'File is not on local filesystem'}), 400
 
-        if not os.path.exists(local_path):
+        try:
+            st = os.stat(local_path)
+        except FileNotFoundError:
             return jsonify({'error': 'File not found'}), 404
 
-        if not os.path.isfile(local_path):
+        if not stat.S_ISREG(st.st_mode):
             return jsonify({'error': 'Path is not a file'}), 400
 
         # Check size
-        file_size = os.path.getsize(local_path)
-        if file_size >= config.max_uncompressed_download_size:
+        if st.st_size >= config.max_uncompressed_download_size:
             return jsonify({'error': 'File too large for preview'}), 400
 
         # Serve file for inline display (not as attachment)
@@ -561,6 +1074,51 @@ def preview_file():
         return jsonify({'error': str(e)}), 500
 
 
+def _unlink_quietly(path: str):
+    """Remove a file, ignoring it if it is already gone"""
+    try:
+        os.unlink(path)
+        logging.info(f"Cleaned up temp file: {path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"Failed to cleanup temp file {path}: {e}")
+
+
+def _send_temp_file(path: str, download_name: str, mimetype: str = None):
+    """
+    Send a file that should be removed once it has been downloaded
+
+    On POSIX the file is unlinked as soon as it is opened: the open handle
+    keeps the data readable until the response is closed, and the kernel
+    frees it afterwards. Where open files cannot be unlinked (Windows), it
+    is removed when the response is closed instead.
+
+    Raises:
+        FileNotFoundError: If the file no longer exists
+    """
+    f = open(path, 'rb')
+    try:
+        size = os.fstat(f.fileno()).st_size
+        unlinked = True
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            unlinked = False
+
+        response = send_file(f, as_attachment=True, download_name=download_name, mimetype=mimetype)
+        response.content_length = size
+        if not unlinked:
+            response.call_on_close(lambda: _unlink_quietly(path))
+        return response
+    except BaseException:
+        # The response never took ownership of the handle
+        f.close()
+        raise
+
+
 @files_bp.route('/api/files/download/direct', methods=['POST'])
 @token_required
 def download_direct():
@@ -576,9 +1134,9 @@ def download_direct():
     Returns: File download
     """
     try:
-        data = request.get_json()
-        if not data or 'path' not in data:
-            return jsonify({'error': 'Missing required field: path'}), 400
+        data, error = parse_request_json(_PATH_REQUEST)
+        if error:
+            return jsonify({'error': error}), 400
 
         path = data['path']
         remote_config = data.get('remote_config')
@@ -596,28 +1154,16 @@ def download_direct():
             if ':' in filename:
                 filename = filename.split(':', 1)[-1]
 
-            @after_this_request
-            def cleanup(response):
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                        logging.info(f"Cleaned up temp file: {temp_file}")
-                except Exception as e:
-                    logging.error(f"Failed to cleanup temp file: {e}")
-                return response
-
-            return send_file(
-                temp_file,
-                as_attachment=True,
-                download_name=filename
-            )
+            return _send_temp_file(temp_file, filename)
         else:
             # Resolved to local filesystem - direct send
             logging.info(f"Direct download of local file (resolved from {path} to {local_path})")
-            if not os.path.exists(local_path):
+            try:
+                st = os.stat(local_path)
+            except FileNotFoundError:
                 return jsonify({'error': 'File not found'}), 404
 
-            if not os.path.isfile(local_path):
+            if not stat.S_ISREG(st.st_mode):
                 return jsonify({'error': 'Path is not a file'}), 400
 
             return send_file(
@@ -631,6 +1177,31 @@ def download_direct():
         return jsonify({'error': str(e)}), 500
 
 
+@files_bp.route('/api/files/download/stream/<stream_token>', methods=['GET'])
+@token_required
+def download_stream(stream_token):
+    """
+    Download a ZIP built on the fly for paths registered by download/prepare
+
+    Each stream token can be used once.
+
+    Returns: Streamed zip file download
+    """
+    stream = _zip_streams.pop(stream_token)
+    if not stream:
+        return jsonify({'error': 'Download not found'}), 404
+
+    logging.info(f"Streaming zip {stream['filename']} for {len(stream['paths'])} paths")
+
+    return Response(
+        _generate_zip_stream(stream['paths'], stream['remote_config']),
+        mimetype='application/zip',
+        headers={
+            'Content-Disposition': f"attachment; filename*=UTF-8''{quote(stream['filename'])}",
+        }
+    )
+
+
 @files_bp.route('/api/files/download/zip/<download_token>', methods=['GET'])
 @token_required
 def download_zip(download_token):
@@ -646,44 +1217,46 @@ def download_zip(download_token):
         config = current_app.motus_config
 
         # Find job by download token
-        jobs = db.list_jobs(limit=1000)  # Search recent jobs
-        job = None
-        for j in jobs:
-            if j.get('download_token') == download_token:
-                job = j
-                break
-
-        if not job:
+        job = db.get_job_by_download_token(download_token)
+
+        if not job or not hmac.compare_digest(job.get('download_token') or '', download_token):
             return jsonify({'error': 'Download not found'}), 404
 
         if job['status'] != 'completed':
             return jsonify({'error': 'Download not ready', 'status': job['status']}), 400
 
         zip_path = job.get('zip_path')
-        if not zip_path or not os.path.exists(zip_path):
+        if not zip_path:
             return jsonify({'error': 'Download expired or not found'}), 410
 
         zip_filename = job.get('zip_filename', 'download.zip')
 
-        logging.info(f"Sending zip file: {zip_path}")
+        if config.download_accel_redirect:
+            if not os.path.exists(zip_path):
+                return jsonify({'error': 'Download expired or not found'}), 410
 
-        # Clean up after download
-        @after_this_request
-        def cleanup(response):
-            try:
-                if os.path.exists(zip_path):
-                    safe_remove(zip_path)
-                    logging.info(f"Cleaned up zip file: {zip_path}")
-            except Exception as e:
-                logging.error(f"Failed to cleanup zip file: {e}")
-            return response
+            # Let the reverse proxy send the file; it keeps its own handle open,
+            # so the zip can be removed shortly after
+            relative_path = os.path.relpath(zip_path, config.download_cache_dir)
+            accel_path = f"{config.download_accel_redirect.rstrip('/')}/{quote(relative_path)}"
+            logging.info(f"Offloading zip file to reverse proxy: {zip_path} -> {accel_path}")
 
-        return send_file(
-            zip_path,
-            as_attachment=True,
-            download_name=zip_filename,
-            mimetype='application/zip'
-        )
+            timer = threading.Timer(ACCEL_CLEANUP_DELAY, _unlink_quietly, args=(zip_path,))
+            timer.daemon = True
+            timer.start()
+
+            return Response(headers={
+                'X-Accel-Redirect': accel_path,
+                'Content-Type': 'application/zip',
+                'Content-Disposition': f"attachment; filename*=UTF-8''{quote(zip_filename)}",
+            })
+
+        logging.info(f"Sending zip file: {zip_path}")
+
+        try:
+            return _send_temp_file(zip_path, zip_filename, mimetype='application/zip')
+        except FileNotFoundError:
+            return jsonify({'error': 'Download expired or not found'}), 410
 
     except Exception as e:
         logging.error(f"Zip download error: {e}")
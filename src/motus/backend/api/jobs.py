@@ -6,6 +6,7 @@ import logging
 from flask import Blueprint, request, jsonify
 
 from ..auth import token_required
+from ..json_utils import request_json
 from ..rclone.wrapper import RcloneWrapper
 from ..rclone.exceptions import RcloneException
 from ..models import Database
@@ -52,7 +53,7 @@ def copy_files():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
 
@@ -115,7 +116,7 @@ def move_files():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
 
@@ -193,12 +194,13 @@ def get_job_status(job_id):
         running_jobs = rclone.get_running_jobs()
 
         if job_id in running_jobs:
-            # Job is active - get live status from rclone
-            finished = rclone.job_finished(job_id)
-            progress = rclone.job_percent(job_id)
-            text = rclone.job_text(job_id)
-            error_text = rclone.job_error_text(job_id)
-            exit_status = rclone.job_exitstatus(job_id)
+            # Job is active - get live status from rclone (one consistent snapshot)
+            job_status = rclone.job_status(job_id)
+            finished = job_status['finished']
+            progress = job_status['percent']
+            text = job_status['text']
+            error_text = job_status['error_text']
+            exit_status = job_status['exit_status']
 
             # Determine status
             if finished:
@@ -216,14 +218,18 @@ def get_job_status(job_id):
                 if log_text is None:
                     logging.warning(f"Job {job_id}: Unable to read log file for finished job")
 
-            # Update database with live status
-            db.update_job(
-                job_id=job_id,
-                status=status,
-                progress=progress,
-                error_text=error_text if error_text else None,
-                log_text=log_text,
-            )
+            # Update database with live status (polls repeat the same values
+            # most of the time, so only write when something changed)
+            if (log_text is not None or status != job['status']
+                    or progress != job['progress']
+                    or (error_text or None) != job.get('error_text')):
+                db.update_job(
+                    job_id=job_id,
+                    status=status,
+                    progress=progress,
+                    error_text=error_text if error_text else None,
+                    log_text=log_text,
+                )
 
             # Clean up log file after storing in database (only if we successfully read it)
             if finished and log_text is not None:
@@ -237,12 +243,13 @@ def get_job_status(job_id):
             # IMPORTANT: If DB says 'running' but job not in queue, it finished
             # so fast we never polled while it was running. Check completion now.
             if status == 'running':
-                finished = rclone.job_finished(job_id)
+                job_status = rclone.job_status(job_id)
+                finished = job_status['finished']
                 if finished:
                     # Job actually finished - get final status
-                    exit_status = rclone.job_exitstatus(job_id)
+                    exit_status = job_status['exit_status']
                     progress = 100
-                    error_text = rclone.job_error_text(job_id)
+                    error_text = job_status['error_text']
 
                     if exit_status == 0:
                         status = 'completed'
@@ -413,22 +420,24 @@ def list_jobs():
         # and update any fast-finishing jobs that show as 'running'
         # but are no longer in the queue (completed between polls)
         running_jobs = rclone.get_running_jobs()
+        progress_updates = {}
         for job in jobs:
             if job['status'] == 'running':
                 if job['job_id'] in running_jobs:
                     # Job is actively running - enrich with live data
-                    job['progress'] = rclone.job_percent(job['job_id'])
-                    job['text'] = rclone.job_text(job['job_id'])
-
-                    # Update database with current progress
-                    db.update_job(
-                        job_id=job['job_id'],
-                        progress=job['progress'],
-                    )
+                    job_status = rclone.job_status(job['job_id'])
+                    progress = job_status['percent']
+                    job['text'] = job_status['text']
+
+                    # Collect changed progress for one batched database update
+                    if progress != job['progress']:
+                        progress_updates[job['job_id']] = progress
+                    job['progress'] = progress
                 else:
                     # Fast job finished - check and update
-                    if rclone.job_finished(job['job_id']):
-                        exit_status = rclone.job_exitstatus(job['job_id'])
+                    job_status = rclone.job_status(job['job_id'])
+                    if job_status['finished']:
+                        exit_status = job_status['exit_status']
                         if exit_status == 0:
                             job['status'] = 'completed'
                         else:
@@ -444,13 +453,15 @@ def list_jobs():
                             job_id=job['job_id'],
                             status=job['status'],
                             progress=100,
-                            error_text=rclone.job_error_text(job['job_id']) or None,
+                            error_text=job_status['error_text'] or None,
                             log_text=log_text,
                         )
 
                         # Clean up log file after storing in database (always cleanup)
                         rclone.job_cleanup_log(job['job_id'])
 
+        db.update_jobs_progress(progress_updates)
+
         return jsonify({'jobs': jobs})
 
     except Exception as e:
@@ -513,7 +524,7 @@ def check_integrity():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
 
@@ -2,11 +2,13 @@
 Remote management API endpoints
 Handles listing, adding, and deleting rclone remotes
 """
+import hashlib
 import logging
-import os
-from flask import Blueprint, request, jsonify
+import re
+from flask import Blueprint, current_app, request, jsonify
 
 from ..auth import token_required
+from ..json_utils import dumps, request_json
 from ..rclone.rclone_config import RcloneConfig, RemoteTemplate
 from ..rclone.exceptions import RcloneException
 from ..rclone.oauth import OAuthRefreshManager, is_oauth_remote
@@ -14,12 +16,22 @@ from ..rclone.custom_remote import CustomRemoteCreationManager
 
 remotes_bp = Blueprint('remotes', __name__)
 
+# Characters rclone allows in remote names (\Z: no trailing newline accepted)
+_REMOTE_NAME_RE = re.compile(r'[a-zA-Z0-9_\-\.\+@ ]+\Z')
+
 # Global instances (initialized by app)
 rclone_config = None
 remote_template = None
 oauth_manager = None
 custom_remote_manager = None
 
+# (rclone_config.generation, JSON bytes, ETag) of the last /api/remotes listing
+_remotes_listing = None
+
+# Templates are loaded once at startup, so /api/templates is served from a
+# prebuilt body: (JSON bytes, ETag)
+_templates_listing = None
+
 
 def init_remote_management(config_file: str, template_file: str = None, rclone_path: str = None,
                           readonly_config_file: str = None, cache_dir: str = None):
@@ -33,7 +45,7 @@ def init_remote_management(config_file: str, template_file: str = None, rclone_p
         readonly_config_file: Optional path to readonly remotes config (from --extra-remotes)
         cache_dir: Cache directory for merged config file
     """
-    global rclone_config, remote_template, oauth_manager, custom_remote_manager
+    global rclone_config, remote_template, oauth_manager, custom_remote_manager, _templates_listing
 
     # Initialize RcloneConfig with two-tier support
     rclone_config = RcloneConfig(
@@ -42,14 +54,16 @@ def init_remote_management(config_file: str, template_file: str = None, rclone_p
         cache_dir=cache_dir
     )
 
-    if template_file and os.path.exists(template_file):
-        remote_template = RemoteTemplate(template_file)
-        logging.info(f"Remote templates loaded from {template_file}")
-    else:
-        remote_template = None
-        if template_file:
+    remote_template = None
+    if template_file:
+        try:
+            remote_template = RemoteTemplate(template_file)
+            logging.info(f"Remote templates loaded from {template_file}")
+        except FileNotFoundError:
             logging.warning(f"Remote templates file not found: {template_file}")
 
+    _templates_listing = _build_templates_listing()
+
     # Initialize OAuth manager and Custom Remote manager
     # IMPORTANT: Use user_config_file (not merged config) because rclone writes directly to the config
     # After rclone writes (OAuth token, new remote), the merged config is regenerated
@@ -83,29 +97,38 @@ def list_remotes():
         "count": 2
     }
     """
+    global _remotes_listing
+
     try:
         logging.info("Listing configured rclone remotes")
 
-        # Reload config to get latest remotes
+        # Reload config to get latest remotes (no-op if the file is unchanged)
         rclone_config.reload()
 
-        # Get all remotes with their configurations
-        remote_names = rclone_config.list_remotes()
-        remotes = []
-        for name in remote_names:
-            config = rclone_config.get_remote(name)
-            remotes.append({
-                'name': name,
-                'type': config.get('type', 'unknown'),
-                'config': config,
-                'is_oauth': is_oauth_remote(config),
-                'is_readonly': rclone_config.is_readonly_remote(name),
+        # Reuse the body built for the same parse of the config
+        generation = rclone_config.generation
+        listing = _remotes_listing
+        if listing is None or listing[0] != generation:
+            remotes = []
+            for name in rclone_config.list_remotes():
+                config = rclone_config.get_remote(name)
+                remotes.append({
+                    'name': name,
+                    'type': config.get('type', 'unknown'),
+                    'config': config,
+                    'is_oauth': is_oauth_remote(config),
+                    'is_readonly': rclone_config.is_readonly_remote(name),
+                })
+            body = dumps({
+                'remotes': remotes,
+                'count': len(remotes),
             })
+            listing = (generation, body, hashlib.blake2b(body, digest_size=8).hexdigest())
+            _remotes_listing = listing
 
-        return jsonify({
-            'remotes': remotes,
-            'count': len(remotes),
-        })
+        response = current_app.response_class(listing[1], mimetype='application/json')
+        response.set_etag(listing[2], weak=True)
+        return response.make_conditional(request)
 
     except Exception as e:
         logging.error(f"List remotes error: {e}")
@@ -156,8 +179,6 @@ def validate_remote_name(name):
 
     Returns (is_valid, error_message)
     """
-    import re
-
     if not name:
         return False, "Remote name cannot be empty"
 
@@ -170,7 +191,7 @@ def validate_remote_name(name):
         return False, "Remote name cannot end with space"
 
     # Check valid characters: letters, numbers, _, -, ., +, @, space
-    if not re.match(r'^[a-zA-Z0-9_\-\.\+@ ]+$', name):
+    if not _REMOTE_NAME_RE.match(name):
         return False, "Remote name may only contain letters, numbers, _, -, ., +, @ and space"
 
     return True, None
@@ -204,7 +225,7 @@ def add_remote():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data or 'name' not in data:
             return jsonify({'error': 'Missing required field: name'}), 400
 
@@ -299,7 +320,7 @@ def update_remote_raw(remote_name):
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data or 'raw_config' not in data:
             return jsonify({'error': 'Missing required field: raw_config'}), 400
 
@@ -346,7 +367,7 @@ def create_remote_raw():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json()
         if not data or 'raw_config' not in data:
             return jsonify({'error': 'Missing required field: raw_config'}), 400
 
@@ -372,6 +393,29 @@ def create_remote_raw():
         return jsonify({'error': str(e)}), 500
 
 
+def _build_templates_listing():
+    """
+    Serialize the /api/templates response body
+
+    Returns:
+        Tuple of (JSON bytes, ETag)
+    """
+    templates = []
+    if remote_template:
+        for name in remote_template.list_templates():
+            templates.append({
+                'name': name,
+                'fields': remote_template.get_template(name)['fields'],
+            })
+
+    body = dumps({
+        'templates': templates,
+        'count': len(templates),
+        'available': remote_template is not None,
+    })
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
 @remotes_bp.route('/api/templates', methods=['GET'])
 @token_required
 def list_templates():
@@ -397,28 +441,10 @@ def list_templates():
     try:
         logging.info("Listing remote templates")
 
-        if not remote_template:
-            return jsonify({
-                'templates': [],
-                'count': 0,
-                'available': False,
-            })
-
-        # Get all templates with their fields
-        template_names = remote_template.list_templates()
-        templates = []
-        for name in template_names:
-            template = remote_template.get_template(name)
-            templates.append({
-                'name': name,
-                'fields': template['fields'],
-            })
-
-        return jsonify({
-            'templates': templates,
-            'count': len(templates),
-            'available': True,
-        })
+        body, etag = _templates_listing
+        response = current_app.response_class(body, mimetype='application/json')
+        response.set_etag(etag, weak=True)
+        return response.make_conditional(request)
 
     except Exception as e:
         logging.error(f"List templates error: {e}")
@@ -497,7 +523,7 @@ def submit_oauth_token(remote_name):
         if not oauth_manager:
             return jsonify({'error': 'OAuth manager not initialized'}), 500
 
-        data = request.get_json()
+        data = request_json()
         if not data or 'token' not in data:
             return jsonify({'error': 'Missing required field: token'}), 400
 
@@ -574,7 +600,7 @@ def start_custom_remote():
         if not custom_remote_manager:
             return jsonify({'error': 'Custom remote manager not initialized'}), 500
 
-        data = request.get_json()
+        data = request_json()
         if not data or 'name' not in data or 'type' not in data:
             return jsonify({'error': 'Missing required fields: name and type'}), 400
 
@@ -625,7 +651,7 @@ def continue_custom_remote():
         if not custom_remote_manager:
             return jsonify({'error': 'Custom remote manager not initialized'}), 500
 
-        data = request.get_json()
+        data = request_json()
         if not data or 'session_id' not in data or 'answer' not in data:
             return jsonify({'error': 'Missing required fields: session_id and answer'}), 400
 
@@ -667,7 +693,7 @@ def cancel_custom_remote():
         if not custom_remote_manager:
             return jsonify({'error': 'Custom remote manager not initialized'}), 500
 
-        data = request.get_json()
+        data = request_json()
         if not data or 'session_id' not in data:
             return jsonify({'error': 'Missing required field: session_id'}), 400
 
@@ -703,7 +729,7 @@ def resolve_alias():
     }
     """
     try:
-        data = request.get_json()
+        data = request_json() or {}
         remote_name = data.get('remote')
         path = data.get('path', '')
 
@@ -738,17 +764,3 @@ def resolve_alias():
     except Exception as e:
         logging.error(f"Resolve alias error: {e}")
         return jsonify({'error': str(e)}), 500
-
-
-@remotes_bp.route('/', methods=['GET'])
-def serve_index():
-    """
-    Serve the main index.html page
-
-    Note: The old OAuth callback handling has been removed since we now use
-    the interactive rclone authorize flow instead of the proxy-based flow.
-    """
-    from flask import current_app, send_from_directory
-    return send_from_directory(current_app.static_folder, 'index.html')
-
-
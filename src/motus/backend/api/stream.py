@@ -1,22 +1,42 @@
 """
 Server-Sent Events (SSE) for real-time job progress
 """
-import json
 import logging
 import time
-from flask import Blueprint, Response, request
+from flask import Blueprint, Response, request, stream_with_context
 
 from ..auth import token_required
+from ..json_utils import dumps
 from ..rclone.wrapper import RcloneWrapper
 from ..models import Database
 
 stream_bp = Blueprint('stream', __name__)
 
+# Send a comment line when a job has been quiet this long, so proxies keep
+# the connection open
+SSE_KEEPALIVE_INTERVAL = 21
+# rclone prints a progress block as several lines; wait this long after the
+# first change so a whole block goes out as one event
+SSE_COALESCE_DELAY = 0.25
+# Jobs outside the job queue (e.g. zip jobs, updated only in the database)
+# never signal a change, so re-check them this often
+SSE_POLL_INTERVAL = 2
+
 # Global instances (initialized by app)
 rclone = None
 db = None
 
 
+def _sse(obj, event: bytes = b"") -> bytes:
+    """Encode obj as one SSE data frame, optionally with a named event type"""
+    if event:
+        return b"event: " + event + b"\ndata: " + dumps(obj) + b"\n\n"
+    return b"data: " + dumps(obj) + b"\n\n"
+
+
+_KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+
 def init_stream(rclone_instance: RcloneWrapper, db_instance: Database):
     """Initialize rclone wrapper and database"""
     global rclone, db
@@ -32,8 +52,12 @@ def stream_job_progress(job_id):
 
     Response: text/event-stream
 
-    Event format:
-    data: {"progress": 45, "text": "...", "finished": false}
+    Event format (the first event carries the full state):
+    data: {"job_id": 1, "status": "running", "progress": 45, "text": "...", "finished": false, ...}
+
+    Later events only carry the fields that changed, to be merged into it:
+    event: delta
+    data: {"progress": 46, "text": "..."}
 
     """
     def generate():
@@ -42,18 +66,23 @@ def stream_job_progress(job_id):
             # Verify job exists
             job = db.get_job(job_id)
             if not job:
-                yield f"data: {json.dumps({'error': 'Job not found'})}\n\n"
+                yield _sse({'error': 'Job not found'})
                 return
 
-            # Stream updates until job finishes
+            # Stream updates until job finishes, waking up when the job
+            # queue reports a change instead of polling
+            version = rclone.job_version(job_id)
+            last_event = None
+            last_sent = time.monotonic()
             while True:
                 try:
-                    # Get current status
-                    finished = rclone.job_finished(job_id)
-                    progress = rclone.job_percent(job_id)
-                    text = rclone.job_text(job_id)
-                    error_text = rclone.job_error_text(job_id)
-                    exit_status = rclone.job_exitstatus(job_id)
+                    # Get current status (one consistent snapshot)
+                    snapshot = rclone.job_status(job_id)
+                    finished = snapshot['finished']
+                    progress = snapshot['percent']
+                    text = snapshot['text']
+                    error_text = snapshot['error_text']
+                    exit_status = snapshot['exit_status']
 
                     # Get current job status from database
                     job = db.get_job(job_id)
@@ -70,50 +99,76 @@ def stream_job_progress(job_id):
                         'exit_status': exit_status,
                     }
 
-                    # Send event
-                    yield f"data: {json.dumps(event_data)}\n\n"
-
-                    # Update database
-                    if finished:
-                        status = 'completed' if exit_status == 0 else 'failed'
-                        db.update_job(
-                            job_id=job_id,
-                            status=status,
-                            progress=progress,
-                            error_text=error_text if error_text else None,
-                        )
-                        break
-                    else:
-                        # Only update status to 'running' if job is actually running
-                        # Don't change status for stopped/aborted jobs
-                        current_status = job.get('status')
-                        if current_status in ('running', 'pending'):
+                    if event_data != last_event:
+                        # Send event (full state first, then only changed fields)
+                        if last_event is None:
+                            yield _sse(event_data)
+                        else:
+                            delta = {k: v for k, v in event_data.items() if last_event[k] != v}
+                            yield _sse(delta, b"delta")
+                        last_event = event_data
+                        last_sent = time.monotonic()
+
+                        # Update database
+                        if finished:
+                            status = 'completed' if exit_status == 0 else 'failed'
+                            db.update_job(
+                                job_id=job_id,
+                                status=status,
+                                progress=progress,
+                                error_text=error_text if error_text else None,
+                            )
+                            break
+                        elif current_status == 'running' and job.get('progress') == progress:
+                            # Another client watching this job already stored it
+                            pass
+                        elif current_status in ('running', 'pending'):
+                            # Only update status to 'running' if job is actually running
+                            # Don't change status for stopped/aborted jobs
                             db.update_job(
                                 job_id=job_id,
                                 status='running',
                                 progress=progress,
                             )
-                        else:
+                        elif job and job.get('progress') != progress:
                             # Job is stopped/aborted, just update progress without changing status
                             db.update_job(
                                 job_id=job_id,
                                 progress=progress,
                             )
 
-                    # Wait before next update
-                    time.sleep(2)
+                    # Wait for the next change
+                    if job_id in rclone.get_running_jobs():
+                        timeout = SSE_KEEPALIVE_INTERVAL
+                    else:
+                        timeout = SSE_POLL_INTERVAL
+                    new_version = rclone.wait_for_job_update(job_id, version, timeout)
+                    if new_version == version:
+                        # Nothing happened; re-check (the DB status may have
+                        # been changed elsewhere) and keep the connection alive
+                        if time.monotonic() - last_sent >= SSE_KEEPALIVE_INTERVAL:
+                            yield _KEEPALIVE_FRAME
+                            last_sent = time.monotonic()
+                    else:
+                        time.sleep(SSE_COALESCE_DELAY)
+                        version = rclone.job_version(job_id)
 
                 except Exception as e:
                     logging.error(f"Error in SSE stream: {e}")
-                    yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                    yield _sse({'error': str(e)})
                     break
 
+        except GeneratorExit:
+            # Client went away: the server closed the generator on a failed write
+            logging.debug(f"SSE client for job {job_id} disconnected")
+            raise
+
         except Exception as e:
             logging.error(f"Error in SSE generator: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield _sse({'error': str(e)})
 
     return Response(
-        generate(),
+        stream_with_context(generate()),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
@@ -2,11 +2,18 @@
 File upload API endpoint for drag-and-drop from desktop
 Handles uploading files to temporary cache and initiating copy jobs
 """
+import errno
 import logging
 import os
 import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from flask import Blueprint, request, jsonify
+from urllib.parse import unquote
+from flask import Blueprint, Request, request, jsonify
+from werkzeug.exceptions import ClientDisconnected
 from werkzeug.utils import secure_filename
 
 from ..auth import token_required
@@ -18,9 +25,29 @@ upload_bp = Blueprint('upload', __name__)
 rclone_wrapper = None
 cache_dir = None
 max_upload_size = 0  # 0 = unlimited
+max_cache_size = 0  # 0 = unlimited
+db = None
 
+# Upload directories touched this recently are never evicted (their copy
+# job may not have been created yet)
+CACHE_EVICT_MIN_IDLE = 300
+_evict_lock = threading.Lock()
 
-def init_upload(rclone, upload_cache_path: str, max_size: int = 0):
+# Upload cache directories are deleted off the request thread
+_cleanup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='upload-cleanup')
+
+# Chunk size for copying raw upload bodies to disk
+RAW_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Partial files of chunked direct uploads older than this are removed when
+# a new chunked upload starts in the same folder (abandoned uploads)
+PARTIAL_UPLOAD_MAX_AGE = 24 * 3600
+# Chunk size for in-kernel copies when a rename crosses filesystems
+COPY_RANGE_CHUNK_SIZE = 16 * 1024 * 1024
+# Direct uploads at least this large are dropped from the page cache once written
+DROP_CACHE_MIN_SIZE = 8 * 1024 * 1024
+
+
+def init_upload(rclone, upload_cache_path: str, max_size: int = 0, max_cache: int = 0, db_instance=None):
     """
     Initialize upload management
 
@@ -28,12 +55,16 @@ def init_upload(rclone, upload_cache_path: str, max_size: int = 0):
         rclone: RcloneWrapper instance
         upload_cache_path: Path to upload cache directory
         max_size: Maximum upload size in bytes (0 = unlimited)
+        max_cache: Upload cache size limit in bytes (0 = unlimited)
+        db_instance: Database, used to find jobs still reading from the cache
     """
-    global rclone_wrapper, cache_dir, max_upload_size
+    global rclone_wrapper, cache_dir, max_upload_size, max_cache_size, db
 
     rclone_wrapper = rclone
     cache_dir = Path(upload_cache_path)
     max_upload_size = max_size
+    max_cache_size = max_cache
+    db = db_instance
 
     # Create cache directory if it doesn't exist
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -42,6 +73,217 @@ def init_upload(rclone, upload_cache_path: str, max_size: int = 0):
         logging.info(f"Maximum upload size: {format_size(max_upload_size)}")
     else:
         logging.info("Maximum upload size: unlimited")
+    if max_cache_size > 0:
+        logging.info(f"Upload cache size limit: {format_size(max_cache_size)}")
+
+
+class UploadRequest(Request):
+    """
+    Request class that spools uploaded files into the upload cache directory
+
+    Werkzeug normally spools file parts to a temporary file in the system
+    temp directory, and FileStorage.save() then copies it to its destination.
+    Spooling /api/upload parts next to their destination lets _save_upload()
+    rename the file into place instead of copying it a second time.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if cache_dir is not None and self.endpoint == 'upload.upload_files':
+            return _create_temp_file(cache_dir)
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
+
+def _create_temp_file(directory):
+    """
+    Create a new, uniquely named temporary upload file opened for read/write
+
+    Unlike tempfile (always 0600) the file is created with mode 0666 and the
+    kernel applies the umask, so it gets the permissions of any newly written
+    file once renamed into place. Its name attribute is the path.
+    """
+    # 'x' mode is O_CREAT | O_EXCL: never reuse an existing file
+    return open(os.path.join(directory, f".upload-{uuid.uuid4().hex}"), 'x+b')
+
+
+def _spooled_path(file):
+    """Return the path of the temporary file an upload was spooled to, or None"""
+    name = getattr(file.stream, 'name', None)
+    return name if isinstance(name, str) else None
+
+
+def _save_upload(file, file_path: Path):
+    """
+    Move an uploaded file to file_path
+
+    Files spooled by UploadRequest are renamed into place (moved across
+    filesystems if needed); anything else falls back to FileStorage.save().
+    """
+    spooled = _spooled_path(file)
+    if spooled is None:
+        file.save(str(file_path))
+        return
+
+    file.stream.close()
+    _move_file(spooled, file_path)
+
+
+def _move_file(src: str, dst):
+    """
+    Move a file, renaming it when source and destination share a filesystem
+
+    Across filesystems (e.g. direct uploads outside the cache volume) the
+    data is copied in the kernel with copy_file_range where available, so
+    it never passes through user space; shutil.copyfile is the fallback.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_RANGE_CHUNK_SIZE):
+                    pass
+            copied = True
+        except OSError as e:
+            # Not supported between these filesystems (or by this kernel)
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL):
+                raise
+    if not copied:
+        shutil.copyfile(src, dst)
+    os.unlink(src)
+
+
+def _drop_page_cache(path):
+    """
+    Flush a written upload and tell the kernel its pages are not needed
+
+    Only used for direct uploads: files in the upload cache are read back
+    by rclone right away and should stay cached. Small files are skipped,
+    as the flush costs more than the memory they occupy.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if os.fstat(fd).st_size >= DROP_CACHE_MIN_SIZE:
+                # Dirty pages cannot be dropped, so write them out first
+                os.fdatasync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logging.debug(f"Could not drop {path} from page cache: {e}")
+
+
+def _discard_spooled(files):
+    """Remove spooled temporary files that were not moved into place"""
+    for file in files:
+        spooled = _spooled_path(file)
+        if spooled is not None:
+            try:
+                os.unlink(spooled)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Failed to remove spooled upload {spooled}: {e}")
+
+
+def _remove_in_background(path: Path) -> bool:
+    """
+    Delete a cache directory on a background thread
+
+    The directory is first renamed to a unique .trash-* name (atomic), so
+    a new upload reusing the same job ID starts from an empty directory.
+
+    Returns:
+        True if removal was scheduled, False if the directory does not exist
+    """
+    trash = path.with_name(f".trash-{uuid.uuid4().hex}")
+    try:
+        os.rename(path, trash)
+    except FileNotFoundError:
+        return False
+    _cleanup_executor.submit(shutil.rmtree, trash, True)
+    return True
+
+
+def _tree_size(path: str) -> int:
+    """Total size of the regular files under path (symlinks are not followed)"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            pass
+    return total
+
+
+def _cache_dirs_in_use() -> set:
+    """Names of upload cache directories that running or interrupted jobs copy from"""
+    prefix = str(cache_dir) + os.sep
+    src_paths = []
+    if rclone_wrapper is not None and db is not None:
+        for job_id in rclone_wrapper.get_running_jobs():
+            src_paths.append((db.get_job(job_id) or {}).get('src_path') or '')
+        # All of them, not a page of the UI listing: any may still be resumed
+        src_paths += db.list_aborted_src_paths(prefix)
+
+    in_use = set()
+    for src_path in src_paths:
+        if src_path.startswith(prefix):
+            in_use.add(src_path[len(prefix):].split(os.sep, 1)[0])
+    return in_use
+
+
+def _enforce_cache_limit():
+    """
+    Evict least recently used upload directories while the cache is over max_cache_size
+
+    A directory's last use is its mtime (set when files are uploaded into it).
+    Directories a job still reads from, or used within CACHE_EVICT_MIN_IDLE
+    seconds, are kept.
+    """
+    if max_cache_size <= 0 or not _evict_lock.acquire(blocking=False):
+        return
+    try:
+        candidates = []
+        total = 0
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.trash-'):
+                    size = _tree_size(entry.path)
+                    total += size
+                    candidates.append((entry.stat(follow_symlinks=False).st_mtime, entry.name, size))
+
+        if total <= max_cache_size:
+            return
+
+        in_use = _cache_dirs_in_use()
+        idle_before = time.time() - CACHE_EVICT_MIN_IDLE
+        for mtime, name, size in sorted(candidates):
+            if total <= max_cache_size:
+                break
+            if name in in_use or mtime > idle_before:
+                continue
+            logging.info(f"Upload cache over {format_size(max_cache_size)}, evicting {name} ({format_size(size)})")
+            if _remove_in_background(cache_dir / name):
+                total -= size
+    except Exception as e:
+        logging.warning(f"Error enforcing upload cache limit: {e}")
+    finally:
+        _evict_lock.release()
 
 
 def cleanup_cache(exclude_job_ids=None):
@@ -51,17 +293,25 @@ def cleanup_cache(exclude_job_ids=None):
     Args:
         exclude_job_ids: List of job IDs to exclude from cleanup (active jobs)
     """
-    if not cache_dir or not cache_dir.exists():
+    if not cache_dir:
         return
 
-    exclude_job_ids = exclude_job_ids or []
-    exclude_dirs = {f"job-{job_id}" for job_id in exclude_job_ids}
+    exclude_dirs = frozenset(f"job-{job_id}" for job_id in exclude_job_ids or ())
 
     try:
-        for item in cache_dir.iterdir():
-            if item.is_dir() and item.name not in exclude_dirs:
-                logging.info(f"Cleaning up upload cache: {item}")
-                shutil.rmtree(item, ignore_errors=True)
+        # scandir reports entry types from the directory listing, no stat per entry
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name in exclude_dirs:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    logging.info(f"Cleaning up upload cache: {entry.path}")
+                    _remove_in_background(Path(entry.path))
+                elif entry.name.startswith('.upload-'):
+                    # Spool file left behind by an interrupted upload
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        return
     except Exception as e:
         logging.warning(f"Error cleaning upload cache: {e}")
 
@@ -122,6 +372,7 @@ def upload_files():
 
             # Ensure destination directory exists
             dest_path.mkdir(parents=True, exist_ok=True)
+            created_dirs = {dest_path}
 
             for i, file in enumerate(files):
                 if file.filename:
@@ -135,13 +386,17 @@ def upload_files():
                         filename = secure_filename(file.filename)
                         file_path = dest_path / filename
 
-                    # Create parent directories if needed
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Create parent directories if needed (once per directory)
+                    if file_path.parent not in created_dirs:
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(file_path.parent)
 
                     # Save the file directly to destination
-                    file.save(str(file_path))
+                    _save_upload(file, file_path)
+                    _drop_page_cache(file_path)
                     uploaded_files.append(str(file_path.relative_to(dest_path)))
-                    logging.info(f"Uploaded file directly to local filesystem: {file_path}")
+                    # Lazy formatting: this runs once per file
+                    logging.info("Uploaded file directly to local filesystem: %s", file_path)
 
             return jsonify({
                 'message': 'Files uploaded successfully',
@@ -154,6 +409,7 @@ def upload_files():
         # Create job-specific cache directory
         job_cache = cache_dir / f"job-{job_id}"
         job_cache.mkdir(parents=True, exist_ok=True)
+        created_dirs = {job_cache}
 
         uploaded_files = []
         for i, file in enumerate(files):
@@ -168,13 +424,19 @@ def upload_files():
                     filename = secure_filename(file.filename)
                     file_path = job_cache / filename
 
-                # Create parent directories if needed
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+                # Create parent directories if needed (once per directory)
+                if file_path.parent not in created_dirs:
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(file_path.parent)
 
                 # Save the file
-                file.save(str(file_path))
+                _save_upload(file, file_path)
                 uploaded_files.append(str(file_path.relative_to(job_cache)))
-                logging.info(f"Uploaded file to cache: {file_path}")
+                # Lazy formatting: this runs once per file
+                logging.info("Uploaded file to cache: %s", file_path)
+
+        if max_cache_size > 0:
+            _cleanup_executor.submit(_enforce_cache_limit)
 
         return jsonify({
             'message': 'Files uploaded successfully',
@@ -187,6 +449,210 @@ def upload_files():
         logging.error(f"Upload error: {e}")
         return jsonify({'error': str(e)}), 500
 
+    finally:
+        # Files skipped or left behind by an error are still in the spool
+        _discard_spooled(request.files.getlist('files[]'))
+
+
+def _raw_upload_target_dir(destination: str, job_id: str, direct_upload: bool) -> Path:
+    """Directory a raw upload is written to"""
+    if direct_upload:
+        return Path(destination).expanduser()  # Expand ~ to home directory
+    return cache_dir / f"job-{job_id}"
+
+
+def _partial_upload_path(target_dir: Path, job_id: str, filename: str) -> Path:
+    """Partial file of a chunked upload, private to its upload session"""
+    return target_dir / f".upload-{secure_filename(job_id)}-{filename}.part"
+
+
+def _remove_stale_partials(target_dir: Path):
+    """Remove partial files of chunked uploads abandoned in target_dir"""
+    cutoff = time.time() - PARTIAL_UPLOAD_MAX_AGE
+    try:
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith('.upload-') and entry.name.endswith('.part')
+                        and entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    logging.info(f"Removing abandoned partial upload: {entry.path}")
+                    os.unlink(entry.path)
+    except OSError as e:
+        logging.warning(f"Error removing abandoned partial uploads in {target_dir}: {e}")
+
+
+def _write_at(fd: int, stream, offset: int) -> int:
+    """
+    Write a request stream into fd starting at offset
+
+    Returns:
+        Offset just past the last byte written
+    """
+    while True:
+        chunk = stream.read(RAW_UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return offset
+        view = memoryview(chunk)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            offset += written
+            view = view[written:]
+
+
+@upload_bp.route('/api/upload/raw', methods=['POST'])
+@token_required
+def upload_raw():
+    """
+    Upload a single file sent as the raw request body (no multipart encoding)
+
+    Request headers:
+        - X-Filename: URL-encoded file name
+        - X-Destination: URL-encoded target path (e.g., "/path" or "remote:/path")
+        - X-Job-Id: unique job ID for this upload session
+        - X-Direct-Upload: 'true' for direct local upload (optional)
+        - X-Upload-Length: total file size, to send the file in several
+          requests (optional)
+        - X-Upload-Offset: position of this request's body in the file
+          (required with X-Upload-Length)
+
+    Chunked uploads are written to a partial file next to the target, named
+    after the job ID. Offset 0 starts the file over. A request whose offset
+    does not match the bytes received so far gets a 409 with the current
+    offset, so an interrupted upload resumes from there. Until the last
+    chunk, responses are {"job_id": ..., "offset": N}. DELETE with the same
+    headers discards the partial file of an abandoned upload.
+
+    Response: same as /api/upload once the file is complete
+    """
+    try:
+        filename = secure_filename(unquote(request.headers.get('X-Filename', '')))
+        destination = unquote(request.headers.get('X-Destination', ''))
+        job_id = request.headers.get('X-Job-Id')
+        direct_upload = request.headers.get('X-Direct-Upload') == 'true'
+
+        try:
+            upload_length = int(request.headers.get('X-Upload-Length', -1))
+            upload_offset = int(request.headers.get('X-Upload-Offset', 0))
+        except ValueError:
+            return jsonify({'error': 'Invalid upload length or offset'}), 400
+
+        if not filename:
+            return jsonify({'error': 'No file provided'}), 400
+        if not destination or not job_id:
+            return jsonify({'error': 'Missing destination or job_id'}), 400
+
+        total_size = upload_length if upload_length >= 0 else (request.content_length or 0)
+        if max_upload_size > 0 and total_size > max_upload_size:
+            return jsonify({
+                'error': f'Total upload size ({format_size(total_size)}) exceeds maximum allowed ({format_size(max_upload_size)})'
+            }), 413  # 413 Payload Too Large
+
+        target_dir = _raw_upload_target_dir(destination, job_id, direct_upload)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        file_path = target_dir / filename
+
+        if upload_length >= 0:
+            # Chunked upload: append this request's body to the partial file
+            part_path = _partial_upload_path(target_dir, job_id, filename)
+            flags = os.O_WRONLY | os.O_CREAT
+            if upload_offset == 0:
+                # First chunk: start over, whatever an earlier attempt left
+                flags |= os.O_TRUNC
+                if direct_upload:
+                    _remove_stale_partials(target_dir)
+            fd = os.open(part_path, flags, 0o666)
+            try:
+                received = os.fstat(fd).st_size
+                if upload_offset != received:
+                    return jsonify({'error': 'Upload offset mismatch', 'offset': received}), 409
+
+                try:
+                    received = _write_at(fd, request.stream, upload_offset)
+                except ClientDisconnected:
+                    # Keep the chunks received so far for a resume
+                    os.ftruncate(fd, upload_offset)
+                    raise
+                except BaseException:
+                    os.close(fd)
+                    fd = None
+                    part_path.unlink(missing_ok=True)
+                    raise
+                if received > upload_length:
+                    os.close(fd)
+                    fd = None
+                    part_path.unlink(missing_ok=True)
+                    return jsonify({'error': 'Upload exceeds declared length'}), 400
+            finally:
+                if fd is not None:
+                    os.close(fd)
+
+            if received < upload_length:
+                return jsonify({'job_id': job_id, 'offset': received})
+            os.replace(part_path, file_path)
+        else:
+            # Write next to the target and rename, so an interrupted upload
+            # never leaves a truncated file behind
+            f = _create_temp_file(target_dir)
+            temp_path = f.name
+            try:
+                with f:
+                    shutil.copyfileobj(request.stream, f, RAW_UPLOAD_CHUNK_SIZE)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+
+        if direct_upload:
+            _drop_page_cache(file_path)
+            logging.info(f"Uploaded file directly to local filesystem: {file_path}")
+            location = {'direct_path': str(target_dir)}
+        else:
+            logging.info(f"Uploaded file to cache: {file_path}")
+            location = {'cache_path': str(target_dir)}
+            if max_cache_size > 0:
+                _cleanup_executor.submit(_enforce_cache_limit)
+
+        return jsonify({
+            'message': 'Files uploaded successfully',
+            'job_id': job_id,
+            **location,
+            'files': [filename]
+        })
+
+    except Exception as e:
+        logging.error(f"Raw upload error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@upload_bp.route('/api/upload/raw', methods=['DELETE'])
+@token_required
+def discard_raw_upload():
+    """
+    Discard the partial file of an abandoned chunked upload
+
+    Request headers: X-Filename, X-Destination, X-Job-Id and X-Direct-Upload,
+    as sent with the upload's chunks
+    """
+    try:
+        filename = secure_filename(unquote(request.headers.get('X-Filename', '')))
+        destination = unquote(request.headers.get('X-Destination', ''))
+        job_id = request.headers.get('X-Job-Id')
+        direct_upload = request.headers.get('X-Direct-Upload') == 'true'
+
+        if not filename or not destination or not job_id:
+            return jsonify({'error': 'Missing filename, destination or job_id'}), 400
+
+        target_dir = _raw_upload_target_dir(destination, job_id, direct_upload)
+        _partial_upload_path(target_dir, job_id, filename).unlink(missing_ok=True)
+        return jsonify({'message': 'Partial upload discarded'})
+
+    except Exception as e:
+        logging.error(f"Discard upload error: {e}")
+        return jsonify({'error': str(e)}), 500
+
 
 @upload_bp.route('/api/upload/cleanup/<job_id>', methods=['DELETE'])
 @token_required
@@ -194,15 +660,15 @@ def cleanup_job_cache(job_id):
     """
     Clean up cache for a specific job
 
-    Called after successful file transfer completion
+    Called after successful file transfer completion. The directory is
+    removed in the background (202 Accepted).
     """
     try:
         job_cache = cache_dir / f"job-{job_id}"
 
-        if job_cache.exists():
-            shutil.rmtree(job_cache, ignore_errors=True)
-            logging.info(f"Cleaned up cache for job {job_id}")
-            return jsonify({'message': 'Cache cleaned successfully'})
+        if _remove_in_background(job_cache):
+            logging.info(f"Scheduled cache cleanup for job {job_id}")
+            return jsonify({'message': 'Cache cleanup scheduled'}), 202
         else:
             return jsonify({'message': 'Cache already clean'}), 404
 
@@ -2,31 +2,41 @@
 Main Flask application for Motus
 Single-user rclone GUI with token authentication
 """
+import atexit
+import hashlib
 import json
 import logging
+import logging.handlers
 import os
-import shutil
+import queue
 import signal
 import sys
 import time
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from flask import Flask, send_from_directory, jsonify, request
+from flask import Flask, abort, send_file, jsonify, request
 from flask_cors import CORS
 
-from .config import Config
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+from .config import Config, format_size
+from .json_utils import FastJSONProvider, dumps, json_response, loads, request_json
 from .models import Database
-from .rclone.wrapper import RcloneWrapper
+from .rclone.wrapper import RcloneWrapper, safe_remove
 from .rclone.exceptions import RcloneNotFoundError
-from .auth import token_required
+from .auth import token_required, verify_token
 
 # Import API blueprints
 from .api.files import files_bp, init_files
 from .api.jobs import jobs_bp, init_jobs
 from .api.stream import stream_bp, init_stream
 from .api.remotes import remotes_bp, init_remote_management
-from .api.upload import upload_bp, init_upload, cleanup_cache
+from .api.upload import upload_bp, init_upload, cleanup_cache, UploadRequest
 
 # Detect terminal encoding and set UTF-8 symbols with ASCII fallbacks
 _IS_UTF8 = sys.stderr.encoding and 'utf' in sys.stderr.encoding.lower()
@@ -44,6 +54,9 @@ _idle_timer_stop_event = None
 _zero_frontends_grace_start = None  # Time when counter reached zero (for refresh grace period)
 _grace_period_timer = None  # Timer for grace period shutdown (independent of idle timer)
 _shutting_down = False  # Flag to notify frontends that server is shutting down
+_log_listener = None  # QueueListener writing log records off the request threads
+_preferences = None  # (file (mtime, size), saved preferences or None), reloaded when the file changes
+_preferences_lock = threading.Lock()
 
 # Grace period for frontend disconnections and shutdown coordination (seconds)
 # Used when:
@@ -51,27 +64,27 @@ _shutting_down = False  # Flag to notify frontends that server is shutting down
 # 2. Shutdown initiated (allows all tabs to receive notification via heartbeat)
 GRACE_PERIOD = 10
 
+# Longest wait between idle timer checks (seconds)
+IDLE_CHECK_INTERVAL = 10
+
+# Threads reading orphaned job logs at startup
+LOG_READ_WORKERS = 8
+
 # Ctrl-C (SIGINT) tracking for confirmation
 _sigint_time = None  # Time when first SIGINT was received
 SIGINT_CONFIRMATION_WINDOW = 3  # Seconds to wait for second Ctrl-C
 
+def _download_temp_prefix(config: Config) -> str:
+    """Path prefix of the destinations of two-phase download copy jobs"""
+    return os.path.join(config.download_cache_dir, 'temp', 'download_temp_')
 
-def safe_remove(path):
-    """
-    Safely remove a file or directory
 
-    Handles both files and directories (recursively)
-    """
-    try:
-        if os.path.isdir(path):
-            shutil.rmtree(path)
-        else:
-            os.remove(path)
-    except Exception:
-        raise  # Re-raise for caller to handle
+def _is_download_temp_copy(job: dict, temp_prefix: str) -> bool:
+    """Check if a job is the internal copy phase of a two-phase download"""
+    return job['operation'] == 'copy' and (job['dst_path'] or '').startswith(temp_prefix)
 
 
-def cancel_two_phase_downloads(rclone: RcloneWrapper, db: Database, job_ids, status='cancelled'):
+def cancel_two_phase_downloads(rclone: RcloneWrapper, db: Database, config: Config, job_ids, status='cancelled'):
     """
     Cancel zip jobs and their associated copy jobs
 
@@ -82,10 +95,13 @@ def cancel_two_phase_downloads(rclone: RcloneWrapper, db: Database, job_ids, sta
     Args:
         rclone: RcloneWrapper instance
         db: Database instance
+        config: Configuration object (locates the download cache)
         job_ids: List of job IDs to process (from rclone.get_running_jobs())
         status: Status to set ('cancelled' or 'interrupted')
     """
-    cancelled_jobs = set()
+    # Final statuses are written in one transaction at the end:
+    # job_id -> (job_id, status, error_text, log_text)
+    updates = {}
 
     # Fetch all job details for the provided job_ids
     jobs = {}
@@ -94,49 +110,52 @@ def cancel_two_phase_downloads(rclone: RcloneWrapper, db: Database, job_ids, sta
         if job:
             jobs[job_id] = job
 
+    # Copy jobs in the same job_ids list with destination in cache/temp/,
+    # found once instead of rescanning all jobs for every zip job
+    temp_prefix = _download_temp_prefix(config)
+    temp_copy_ids = [job_id for job_id, job in jobs.items() if _is_download_temp_copy(job, temp_prefix)]
+
     # Identify zip jobs and their associated copy jobs
     for job_id, job in jobs.items():
         try:
             # If it's a zip job, find and cancel associated copy job
             if job['operation'] == 'zip':
-                # Find copy jobs in the same job_ids list with destination in cache/temp/
-                for other_id, other_job in jobs.items():
-                    if (other_job['operation'] == 'copy' and
-                        other_job['dst_path'] and
-                        '/cache/download/temp/download_temp_' in other_job['dst_path']):
-
-                        # Get log text
-                        log_text = rclone.job_log_text(other_id)
-
-                        # Cancel the copy job
-                        db.update_job(
-                            job_id=other_id,
-                            status=status,
-                            error_text=f'Associated with {status} zip job {job_id}',
-                            log_text=log_text
-                        )
-                        rclone.job_cleanup_log(other_id)
-                        cancelled_jobs.add(other_id)
-                        logging.info(f"Cancelled copy job {other_id} associated with zip job {job_id}")
-
-                # Get log text for zip job
-                log_text = rclone.job_log_text(job_id)
+                # (each is cancelled once, by the first zip job)
+                while temp_copy_ids:
+                    other_id = temp_copy_ids.pop()
+
+                    # Cancel the copy job
+                    updates[other_id] = (
+                        other_id,
+                        status,
+                        f'Associated with {status} zip job {job_id}',
+                        rclone.job_log_text(other_id),
+                    )
+                    logging.info(f"Cancelled copy job {other_id} associated with zip job {job_id}")
 
                 # Cancel the zip job
-                db.update_job(
-                    job_id=job_id,
-                    status=status,
-                    error_text='Two-phase download cancelled',
-                    log_text=log_text
+                updates[job_id] = (
+                    job_id,
+                    status,
+                    'Two-phase download cancelled',
+                    rclone.job_log_text(job_id),
                 )
-                rclone.job_cleanup_log(job_id)
-                cancelled_jobs.add(job_id)
                 logging.info(f"Cancelled zip job {job_id}")
 
         except Exception as e:
             logging.error(f"Error cancelling two-phase download for job {job_id}: {e}")
 
-    return cancelled_jobs
+    try:
+        db.finish_jobs(list(updates.values()))
+    except Exception as e:
+        logging.error(f"Error saving cancelled two-phase downloads: {e}")
+        return set()
+
+    # Log files are only removed once their text is stored
+    for job_id in updates:
+        rclone.job_cleanup_log(job_id)
+
+    return set(updates)
 
 
 def perform_shutdown(rclone: RcloneWrapper, db: Database, config: Config):
@@ -154,30 +173,23 @@ def perform_shutdown(rclone: RcloneWrapper, db: Database, config: Config):
         rclone.shutdown()
 
         # Mark zip jobs and their associated copy jobs as interrupted
-        handled_jobs = cancel_two_phase_downloads(rclone, db, running_jobs, 'interrupted')
-
-        # Mark remaining jobs (not part of two-phase downloads) as interrupted
-        for job_id in running_jobs:
-            # Skip if already handled by cancel_two_phase_downloads
-            if job_id in handled_jobs:
-                continue
-
-            try:
-                # Get log text before marking as interrupted
-                log_text = rclone.job_log_text(job_id)
-
-                # Update database with interrupted status and log
-                db.update_job(
-                    job_id=job_id,
-                    status='interrupted',
-                    error_text='Job interrupted by server shutdown',
-                    log_text=log_text
-                )
+        handled_jobs = cancel_two_phase_downloads(rclone, db, config, running_jobs, 'interrupted')
 
-                # Clean up log file
+        # Mark remaining jobs (not part of two-phase downloads) as interrupted,
+        # saving their logs, in one transaction
+        remaining = [job_id for job_id in running_jobs if job_id not in handled_jobs]
+        try:
+            db.finish_jobs([
+                (job_id, 'interrupted', 'Job interrupted by server shutdown', rclone.job_log_text(job_id))
+                for job_id in remaining
+            ])
+            for job_id in remaining:
                 rclone.job_cleanup_log(job_id)
-            except Exception as e:
-                logging.error(f"Error marking job {job_id} as interrupted: {e}")
+        except Exception as e:
+            logging.error(f"Error marking jobs {remaining} as interrupted: {e}")
+
+    # Stop the rclone rcd process (atexit handlers don't run after os._exit)
+    rclone.stop_daemon()
 
     # Clean up connection info files
     cleanup_connection_info(config)
@@ -195,6 +207,9 @@ def perform_shutdown(rclone: RcloneWrapper, db: Database, config: Config):
     cleanup_download_cache(config, clean_all=True)
 
     logging.info("Shutdown complete")
+
+    # Callers exit right after this, so write out any queued log records
+    stop_log_listener()
     return len(running_jobs)
 
 
@@ -210,29 +225,21 @@ def cleanup_connection_info(config: Config):
     connection_file = runtime_dir / 'connection.json'
     dev_port_file = runtime_dir / 'dev-port.json'
 
-    try:
-        if pid_file.exists():
-            pid_file.unlink()
-            logging.debug(f"Removed stale PID file: {pid_file}")
-    except Exception as e:
-        logging.warning(f"Could not remove PID file: {e}")
-
     # DO NOT remove lock socket here - it's actively managed by run.py
     # Removing it here causes the socket to disappear after create_lock_socket()
 
-    try:
-        if connection_file.exists():
-            connection_file.unlink()
-            logging.debug(f"Removed stale connection file: {connection_file}")
-    except Exception as e:
-        logging.warning(f"Could not remove connection file: {e}")
-
-    try:
-        if dev_port_file.exists():
-            dev_port_file.unlink()
-            logging.debug(f"Removed stale dev port file: {dev_port_file}")
-    except Exception as e:
-        logging.warning(f"Could not remove dev port file: {e}")
+    for path, description in (
+        (pid_file, 'PID file'),
+        (connection_file, 'connection file'),
+        (dev_port_file, 'dev port file'),
+    ):
+        try:
+            path.unlink()
+            logging.debug(f"Removed stale {description}: {path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Could not remove {description}: {e}")
 
 
 def setup_signal_handlers(rclone: RcloneWrapper, db: Database, config: Config):
@@ -395,8 +402,10 @@ def idle_timer_worker(max_idle_time: int, rclone: RcloneWrapper, db: Database, c
 
     logging.info(f"Idle timer started - will shutdown after {max_idle_time} seconds of inactivity")
 
-    while not _idle_timer_stop_event.is_set():
-        time.sleep(10)  # Check every 10 seconds
+    # Check every 10 seconds, or sooner when the timeout is due (stop_idle_timer wakes it up)
+    interval = IDLE_CHECK_INTERVAL
+    while not _idle_timer_stop_event.wait(interval):
+        interval = IDLE_CHECK_INTERVAL
 
         # Always keep alive if there are running jobs (backend activity)
         running_jobs = rclone.get_running_jobs()
@@ -422,6 +431,7 @@ def idle_timer_worker(max_idle_time: int, rclone: RcloneWrapper, db: Database, c
                         break
                     else:
                         logging.debug(f"No frontends registered yet - waiting ({time_since_startup:.1f}s / {max_idle_time}s)")
+                        interval = min(IDLE_CHECK_INTERVAL, max(1.0, max_idle_time - time_since_startup))
 
             # Case 2: Frontends registered
             else:
@@ -441,6 +451,7 @@ def idle_timer_worker(max_idle_time: int, rclone: RcloneWrapper, db: Database, c
                     break
                 else:
                     logging.debug(f"Idle check: {frontend_count} frontend(s) registered, last heartbeat {time_since_last_heartbeat:.1f}s ago (idle timeout: {max_idle_time}s)")
+                    interval = min(IDLE_CHECK_INTERVAL, max(1.0, max_idle_time - time_since_last_heartbeat))
 
 
 def start_idle_timer(max_idle_time: int, rclone: RcloneWrapper, db: Database, config: Config):
@@ -505,33 +516,34 @@ def cleanup_orphaned_two_phase_downloads(db: Database, config: Config):
         running_jobs = db.list_jobs(status='running', limit=1000)
         all_jobs = interrupted_jobs + running_jobs
 
-        cancelled_count = 0
+        temp_prefix = _download_temp_prefix(config)
+        updates = []
 
         for job in all_jobs:
             # Cancel zip jobs
             if job['operation'] == 'zip':
-                db.update_job(
-                    job_id=job['job_id'],
-                    status='cancelled',
-                    error_text='Two-phase download cancelled (cannot resume after restart)'
-                )
-                cancelled_count += 1
+                updates.append((
+                    job['job_id'],
+                    'cancelled',
+                    'Two-phase download cancelled (cannot resume after restart)',
+                    None,
+                ))
                 logging.info(f"Cancelled orphaned zip job {job['job_id']}")
 
             # Cancel copy jobs targeting temp directory (internal download jobs)
-            elif (job['operation'] == 'copy' and
-                  job['dst_path'] and
-                  '/cache/download/temp/download_temp_' in job['dst_path']):
-                db.update_job(
-                    job_id=job['job_id'],
-                    status='cancelled',
-                    error_text='Internal download job cancelled (cannot resume after restart)'
-                )
-                cancelled_count += 1
+            elif _is_download_temp_copy(job, temp_prefix):
+                updates.append((
+                    job['job_id'],
+                    'cancelled',
+                    'Internal download job cancelled (cannot resume after restart)',
+                    None,
+                ))
                 logging.info(f"Cancelled orphaned copy job {job['job_id']}")
 
-        if cancelled_count > 0:
-            logging.warning(f"Cancelled {cancelled_count} orphaned two-phase download jobs")
+        db.finish_jobs(updates)
+
+        if updates:
+            logging.warning(f"Cancelled {len(updates)} orphaned two-phase download jobs")
 
     except Exception as e:
         logging.error(f"Error cleaning up orphaned two-phase downloads: {e}")
@@ -544,11 +556,9 @@ def cleanup_orphaned_logs(logs_dir: str, db, rclone):
     - For interrupted/running jobs: save logs to database
     - For other orphaned logs: delete them
     """
-    if not os.path.exists(logs_dir):
-        return
-
     try:
-        log_files = [f for f in os.listdir(logs_dir) if f.startswith('job_') and f.endswith('.log')]
+        with os.scandir(logs_dir) as entries:
+            log_files = [entry for entry in entries if entry.name.startswith('job_') and entry.name.endswith('.log')]
 
         if not log_files:
             return
@@ -561,8 +571,11 @@ def cleanup_orphaned_logs(logs_dir: str, db, rclone):
 
         cleaned = 0
         saved = 0
+        to_save = []  # (job_id, log path) of interrupted jobs
+        orphaned = []
 
-        for log_file in log_files:
+        for entry in log_files:
+            log_file = entry.name
             # Extract job_id from filename: job_123.log -> 123
             try:
                 job_id = int(log_file.replace('job_', '').replace('.log', ''))
@@ -570,30 +583,52 @@ def cleanup_orphaned_logs(logs_dir: str, db, rclone):
                 logging.warning(f"Invalid log filename format: {log_file}")
                 continue
 
-            log_path = os.path.join(logs_dir, log_file)
+            orphaned.append(entry)
 
-            # If this is an interrupted job, save the log to database
+            # If this is an interrupted job, keep the log for the database
             if job_id in interrupted_job_ids:
-                try:
-                    with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                        log_text = f.read()
+                to_save.append((job_id, entry.path))
 
-                    db.update_job(job_id=job_id, log_text=log_text)
-                    logging.info(f"Saved log for interrupted job {job_id} to database")
-                    saved += 1
-                except Exception as e:
-                    logging.warning(f"Failed to save log for job {job_id}: {e}")
+        def read_log(item):
+            job_id, log_path = item
+            try:
+                with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                    return job_id, f.read()
+            except Exception as e:
+                logging.warning(f"Failed to read log for job {job_id}: {e}")
+                return job_id, None
+
+        # Read the logs concurrently (independent files, I/O bound)
+        logs_by_job = {}
+        if to_save:
+            with ThreadPoolExecutor(max_workers=min(LOG_READ_WORKERS, len(to_save))) as executor:
+                for job_id, log_text in executor.map(read_log, to_save):
+                    if log_text is not None:
+                        logs_by_job[job_id] = log_text
+
+        # Save all interrupted job logs in one transaction
+        try:
+            db.save_job_logs(logs_by_job)
+            saved = len(logs_by_job)
+            if saved:
+                logging.info(f"Saved logs for interrupted jobs {sorted(logs_by_job)} to database")
+        except Exception as e:
+            logging.warning(f"Failed to save logs for interrupted jobs: {e}")
 
-            # Delete the log file (whether we saved it or not)
+        # Delete the log files (whether we saved them or not)
+        for entry in orphaned:
             try:
-                os.remove(log_path)
+                os.remove(entry.path)
                 cleaned += 1
             except Exception as e:
-                logging.warning(f"Failed to delete orphaned log file {log_file}: {e}")
+                logging.warning(f"Failed to delete orphaned log file {entry.name}: {e}")
 
         if cleaned > 0 or saved > 0:
             logging.info(f"Cleaned up {cleaned} log files ({saved} saved to database)")
 
+    except FileNotFoundError:
+        # No logs directory yet
+        pass
     except Exception as e:
         logging.error(f"Error during log cleanup: {e}")
 
@@ -610,11 +645,9 @@ def cleanup_download_cache(config: Config, clean_all: bool = False):
     - Called at startup (clean_all=False) and shutdown (clean_all=True)
     """
     cache_dir = config.download_cache_dir
-    if not os.path.exists(cache_dir):
-        return
-
     try:
-        zip_files = [f for f in os.listdir(cache_dir) if f.endswith('.zip')]
+        with os.scandir(cache_dir) as entries:
+            zip_files = [entry for entry in entries if entry.name.endswith('.zip')]
 
         if not zip_files:
             return
@@ -623,8 +656,9 @@ def cleanup_download_cache(config: Config, clean_all: bool = False):
         max_age = config.download_cache_max_age
         cleaned = 0
 
-        for zip_file in zip_files:
-            zip_path = os.path.join(cache_dir, zip_file)
+        for entry in zip_files:
+            zip_file = entry.name
+            zip_path = entry.path
             try:
                 if clean_all:
                     # On shutdown: remove all ZIPs (files or directories)
@@ -633,7 +667,7 @@ def cleanup_download_cache(config: Config, clean_all: bool = False):
                     logging.info(f"Cleaned up zip file on shutdown: {zip_file}")
                 else:
                     # On startup: only remove expired ZIPs
-                    file_age = now - os.path.getmtime(zip_path)
+                    file_age = now - entry.stat().st_mtime
                     if file_age > max_age:
                         safe_remove(zip_path)
                         cleaned += 1
@@ -645,6 +679,9 @@ def cleanup_download_cache(config: Config, clean_all: bool = False):
             action = "all" if clean_all else "expired"
             logging.info(f"Cleaned up {cleaned} {action} zip files from download cache")
 
+    except FileNotFoundError:
+        # No download cache yet
+        pass
     except Exception as e:
         logging.error(f"Error during download cache cleanup: {e}")
 
@@ -677,11 +714,27 @@ def create_app(config: Config = None):
         static_url_path='',
     )
 
+    # jsonify() and request.get_json() go through orjson when it is installed
+    app.json = FastJSONProvider(app)
+    # Uploaded files are spooled into the upload cache and renamed into place
+    app.request_class = UploadRequest
+
     # Flask config
     app.config['SECRET_KEY'] = config.secret_key
     app.config['MOTUS_TOKEN'] = config.token
     # Set max upload size (None = unlimited)
     app.config['MAX_CONTENT_LENGTH'] = config.max_upload_size if config.max_upload_size > 0 else None
+    # Path-based send_file() responses become an X-Sendfile header for the front server
+    app.config['USE_X_SENDFILE'] = config.download_x_sendfile
+
+    # Compress JSON responses (e.g. large listings); file downloads are untouched
+    if config.compress_responses and Compress is not None:
+        app.config['COMPRESS_MIMETYPES'] = ['application/json']
+        app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+        app.config['COMPRESS_LEVEL'] = 4
+        app.config['COMPRESS_BR_LEVEL'] = 4
+        app.config['COMPRESS_STREAMS'] = False
+        Compress(app)
 
     # Enable CORS if configured (for development)
     if config.allow_cors:
@@ -740,7 +793,8 @@ def create_app(config: Config = None):
         readonly_config_file=config.extra_remotes_file if config.extra_remotes_file else None,
         cache_dir=config.cache_dir
     )
-    init_upload(rclone, config.upload_cache_dir, config.max_upload_size)
+    init_upload(rclone, config.upload_cache_dir, config.max_upload_size,
+                config.upload_cache_max_size, db)
 
     # Note: extra_remotes_file is now handled automatically by RcloneConfig's two-tier system
     # Readonly remotes are merged into a temporary config at initialization
@@ -843,67 +897,105 @@ def create_app(config: Config = None):
 def register_routes(app: Flask, config: Config):
     """Register additional routes"""
 
+    # Health and public config never change while the server runs, so
+    # encode them once
+    health_body = dumps({
+        'status': 'ok',
+        'version': '1.0.0',
+    })
+    config_body = dumps({
+        'base_url': config.base_url,
+        'version': '1.0.0',
+        'default_mode': config.default_mode,
+        'max_upload_size': config.max_upload_size,
+        'max_upload_size_formatted': format_size(config.max_upload_size),
+        'max_idle_time': config.max_idle_time,
+        'allow_expert_mode': config.allow_expert_mode,
+        'no_tour': config.no_tour,
+        'startup_remote': config.startup_remote,
+        'local_fs': config.local_fs,
+        'hide_local_fs': config.hide_local_fs,
+        'absolute_paths': config.absolute_paths,
+    })
+    config_etag = hashlib.blake2b(config_body, digest_size=8).hexdigest()
+
+    # Frontend files are resolved once. send_file answers repeat requests
+    # with 304 (ETag / If-Modified-Since); index.html is always revalidated
+    # so a rebuilt frontend is picked up, favicons are cached for a day.
+    index_path = os.path.join(app.static_folder, 'index.html')
+    favicon_ico_path = os.path.join(app.static_folder, 'favicon.ico')
+    favicon_png_path = os.path.join(app.static_folder, 'favicon.png')
+
+    def send_static(path: str, max_age: int):
+        try:
+            return send_file(path, conditional=True, max_age=max_age)
+        except FileNotFoundError:
+            abort(404)
+
     @app.route('/')
     def index():
         """Serve frontend"""
-        return send_from_directory(app.static_folder, 'index.html')
+        return send_static(index_path, 0)
 
     @app.route('/favicon.ico')
     def favicon_ico():
         """Serve favicon.ico if present in frontend directory"""
-        return send_from_directory(app.static_folder, 'favicon.ico')
+        return send_static(favicon_ico_path, 86400)
 
     @app.route('/favicon.png')
     def favicon_png():
         """Serve favicon.png if present in frontend directory"""
-        return send_from_directory(app.static_folder, 'favicon.png')
+        return send_static(favicon_png_path, 86400)
 
     @app.route('/api/health')
     def health():
         """Health check endpoint"""
-        return jsonify({
-            'status': 'ok',
-            'version': '1.0.0',
-        })
+        return app.response_class(health_body, mimetype='application/json')
 
     @app.route('/api/config')
     def get_config():
         """Get public configuration"""
-        from .config import format_size
-        return jsonify({
-            'base_url': config.base_url,
-            'version': '1.0.0',
-            'default_mode': config.default_mode,
-            'max_upload_size': config.max_upload_size,
-            'max_upload_size_formatted': format_size(config.max_upload_size),
-            'max_idle_time': config.max_idle_time,
-            'allow_expert_mode': config.allow_expert_mode,
-            'no_tour': config.no_tour,
-            'startup_remote': config.startup_remote,
-            'local_fs': config.local_fs,
-            'hide_local_fs': config.hide_local_fs,
-            'absolute_paths': config.absolute_paths,
-        })
+        # Revalidate rather than max-age: a restarted server may have a
+        # different configuration
+        response = app.response_class(config_body, mimetype='application/json')
+        response.cache_control.no_cache = True
+        response.set_etag(config_etag, weak=True)
+        return response.make_conditional(request)
 
     @app.route('/api/preferences', methods=['GET'])
     @token_required
     def get_preferences():
         """Get user preferences"""
-        prefs_file = config.preferences_file
+        global _preferences
 
-        if os.path.exists(prefs_file):
-            try:
-                with open(prefs_file, 'r') as f:
-                    prefs = json.load(f)
-                logging.info(f"Loaded preferences from {prefs_file}")
-                return jsonify(prefs)
-            except Exception as e:
-                logging.error(f"Failed to load preferences: {e}")
-        else:
-            logging.info(f"No preferences file found at {prefs_file}, returning defaults")
+        prefs_file = config.preferences_file
+        try:
+            st = os.stat(prefs_file)
+            file_key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            file_key = None
+
+        with _preferences_lock:
+            # Only re-read the file when it changed (e.g. edited by hand)
+            if _preferences is None or _preferences[0] != file_key:
+                prefs = None
+                if file_key is None:
+                    logging.info(f"No preferences file found at {prefs_file}, returning defaults")
+                else:
+                    try:
+                        with open(prefs_file, 'rb') as f:
+                            prefs = loads(f.read())
+                        logging.info(f"Loaded preferences from {prefs_file}")
+                    except Exception as e:
+                        logging.error(f"Failed to load preferences: {e}")
+                _preferences = (file_key, prefs)
+            prefs = _preferences[1]
+
+        if prefs is not None:
+            return json_response(prefs)
 
         # Return defaults (absolute_paths not set means use config default)
-        return jsonify({
+        return json_response({
             'view_mode': 'list',
             'show_hidden_files': False,
             'theme': 'auto'
@@ -913,12 +1005,23 @@ def register_routes(app: Flask, config: Config):
     @token_required
     def save_preferences():
         """Save user preferences"""
+        global _preferences
+
         try:
-            data = request.get_json()
+            data = request_json()
             prefs_file = config.preferences_file
-
-            with open(prefs_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_file = f"{prefs_file}.tmp"
+
+            with _preferences_lock:
+                # Write a temporary file and rename it over the old one, so a
+                # crash never leaves a truncated preferences file
+                with open(tmp_file, 'w') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, prefs_file)
+                st = os.stat(prefs_file)
+                _preferences = ((st.st_mtime_ns, st.st_size), data)
 
             logging.info(f"Saved preferences to {prefs_file}")
             return jsonify({'message': 'Preferences saved'})
@@ -965,7 +1068,7 @@ def register_routes(app: Flask, config: Config):
         """
         global _registered_frontends, _frontends_lock, _shutting_down
 
-        data = request.get_json()
+        data = request_json() or {}
         frontend_id = data.get('frontend_id')
 
         if not frontend_id:
@@ -1013,7 +1116,6 @@ def register_routes(app: Flask, config: Config):
         logging.debug(f"[Unregister] Request data (first 200 bytes): {request.data[:200] if request.data else 'None'}")
 
         # Validate token from header (normal case) or body (sendBeacon case)
-        from .auth import verify_token
         auth_header = request.headers.get('Authorization')
         if auth_header:
             # Normal API call with header
@@ -1024,7 +1126,7 @@ def register_routes(app: Flask, config: Config):
         # If no header, allow it through (sendBeacon from beforeunload)
         # Unregister is safe - worst case is duplicate unregister of non-existent frontend
 
-        data = request.get_json()
+        data = request_json(any_content_type=True)
         if not data:
             logging.warning(f"[Unregister] No JSON data in request - Content-Type was: {request.content_type}")
             return jsonify({'error': 'No JSON data'}), 400
@@ -1069,7 +1171,6 @@ def register_routes(app: Flask, config: Config):
 
         # Shutdown in background thread to allow response to be sent
         def shutdown_delayed():
-            import sys
             print(f"\n[Shutdown] Thread started, waiting {GRACE_PERIOD}s for all frontends to be notified...", file=sys.stderr, flush=True)
             time.sleep(GRACE_PERIOD)  # Give all tabs time to receive shutdown notification via heartbeat
             print("[Shutdown] Calling perform_shutdown()...", file=sys.stderr, flush=True)
@@ -1101,11 +1202,41 @@ def register_routes(app: Flask, config: Config):
         if request.path.startswith('/api/'):
             return jsonify({'error': 'Not found'}), 404
         # Otherwise serve the frontend
-        return send_from_directory(app.static_folder, 'index.html')
+        try:
+            return send_file(index_path, conditional=True, max_age=0)
+        except FileNotFoundError:
+            return e
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves all formatting to the listener thread
+
+    The stock handler formats each record (timestamp, message, traceback)
+    before enqueueing it. The queue never leaves this process, so records can
+    be passed through untouched and the request thread only does the put().
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def stop_log_listener():
+    """Flush queued log records and stop the logging listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(stop_log_listener)
 
 
 def setup_logging(config: Config):
     """Setup logging configuration"""
+    global _log_listener
     import os
     from pathlib import Path
 
@@ -1140,17 +1271,25 @@ def setup_logging(config: Config):
     # Create formatter
     formatter = logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s')
 
-    # Add file handler
+    # File handler
     file_handler = logging.FileHandler(config.log_file)
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
-    # Add stream handler (stderr)
+    # Stream handler (stderr)
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(level)
     stream_handler.setFormatter(formatter)
-    root_logger.addHandler(stream_handler)
+
+    # Request threads only enqueue records; a listener thread does the
+    # (potentially blocking) file and stderr writes
+    stop_log_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _log_listener.start()
 
     # Log confirmation that file logging is working
     logging.info(f"Logging configured: level={config.log_level}, file={config.log_file}")
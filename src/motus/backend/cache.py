@@ -0,0 +1,92 @@
+"""
+Small in-process caches shared by the API modules
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+def fingerprint(value):
+    """
+    Compute a hashable fingerprint for a JSON-like value
+
+    Dicts and lists are frozen into nested tuples, so the result can be
+    used directly as a dict key and compares equal for equal configs
+    without re-serializing them to JSON.
+
+    Args:
+        value: Value to fingerprint (e.g., a remote_config dict or None)
+
+    Returns:
+        Hashable key identifying the value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), fingerprint(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(fingerprint(v) for v in value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        """Return cached value for key, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store value under key"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default if missing or expired"""
+        with self._lock:
+            value = self.get(key, default)
+            self._data.pop(key, None)
+            return value
+
+    def invalidate(self, predicate):
+        """
+        Drop all entries whose key matches predicate
+
+        Args:
+            predicate: Callable taking a key and returning True to drop it
+        """
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
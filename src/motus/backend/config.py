@@ -454,6 +454,21 @@ class Config:
         except ValueError as e:
             raise ValueError(f"Invalid max_upload_size: {e}")
 
+        # Size limit of the upload cache (files waiting to be copied to remotes)
+        # Above it, the least recently used upload directories that no running
+        # or interrupted job reads from are evicted after each upload
+        # Supports formats: 50M, 1G, 1024 (bytes), 0 or "unlimited" = no limit
+        # Default: 0 (unlimited)
+        upload_cache_max_size_str = self._get_config(
+            'upload_cache_max_size',
+            env_var='MOTUS_UPLOAD_CACHE_MAX_SIZE',
+            default='0'
+        )
+        try:
+            self.upload_cache_max_size = parse_size(upload_cache_max_size_str)
+        except ValueError as e:
+            raise ValueError(f"Invalid upload_cache_max_size: {e}")
+
         # Max uncompressed download size before creating zip
         # If total size exceeds this, files will be zipped
         # Supports formats: 50M, 1G, 1024 (bytes)
@@ -491,6 +506,60 @@ class Config:
             default=3600
         ) or 3600)
 
+        # Parallelism of the rclone copy that stages remote data for zip jobs
+        # rclone defaults (4 transfers / 8 checkers) under-use bandwidth for
+        # bulk downloads of many small objects
+        # Default: 32 transfers, 64 checkers
+        self.download_transfers = int(self._get_config(
+            'download_transfers',
+            env_var='MOTUS_DOWNLOAD_TRANSFERS',
+            default=32
+        ) or 32)
+        self.download_checkers = int(self._get_config(
+            'download_checkers',
+            env_var='MOTUS_DOWNLOAD_CHECKERS',
+            default=64
+        ) or 64)
+
+        # Stream multi-file/folder downloads as a ZIP built on the fly
+        # If false, a background job first builds the ZIP in download_cache_dir
+        # Default: true
+        self.stream_zip_downloads = str(self._get_config(
+            'stream_zip_downloads',
+            env_var='MOTUS_STREAM_ZIP_DOWNLOADS',
+            default='true'
+        )).lower() == 'true'
+
+        # Reverse proxy offload for zip downloads (nginx X-Accel-Redirect)
+        # When set to an internal proxy location that maps to download_cache_dir
+        # (e.g. /_motus_downloads/), zip downloads only return the header and the
+        # proxy sends the file itself
+        # Default: None (zip files are streamed by Motus)
+        self.download_accel_redirect = self._get_config(
+            'download_accel_redirect',
+            env_var='MOTUS_DOWNLOAD_ACCEL_REDIRECT',
+            default=None
+        )
+
+        # Let the front web server send local files itself (X-Sendfile header)
+        # For Apache mod_xsendfile / lighttpd in front of Motus; the server must
+        # be allowed to read the shared paths. nginx users: see download_accel_redirect
+        # Default: false
+        self.download_x_sendfile = str(self._get_config(
+            'download_x_sendfile',
+            env_var='MOTUS_DOWNLOAD_X_SENDFILE',
+            default='false'
+        )).lower() == 'true'
+
+        # Compress JSON responses (brotli/gzip) when flask-compress is installed
+        # Large directory listings shrink by an order of magnitude over slow links
+        # Default: true
+        self.compress_responses = str(self._get_config(
+            'compress_responses',
+            env_var='MOTUS_COMPRESS_RESPONSES',
+            default='true'
+        )).lower() == 'true'
+
         # Specific cache subdirectories (computed from cache_dir)
         self.download_cache_dir = os.path.join(self.cache_dir, 'download')
         self.upload_cache_dir = os.path.join(self.cache_dir, 'upload')
@@ -5,7 +5,7 @@ Uses SQLite for simple persistence
 import json
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from contextlib import contextmanager
 
 
@@ -21,6 +21,10 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # WAL lets status polls read while a job update is being written;
+            # the mode is stored in the database file, so set it once here
+            cursor.execute('PRAGMA journal_mode=WAL')
+
             # Jobs table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -68,6 +72,15 @@ class Database:
             except sqlite3.OperationalError:
                 pass  # Column already exists
 
+            # Covering index for zip download lookups: the token lookup reads
+            # status and zip location from the index without touching the table.
+            # Partial, so only zip jobs (the only ones with a token) are indexed.
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_jobs_download_token
+                ON jobs(download_token, status, zip_path, zip_filename)
+                WHERE download_token IS NOT NULL
+            ''')
+
             conn.commit()
 
     @contextmanager
@@ -76,8 +89,10 @@ class Database:
         # Use timeout to handle concurrent access better
         conn = sqlite3.connect(self.db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row
-        # Enable WAL mode for better concurrent access
-        conn.execute('PRAGMA journal_mode=WAL')
+        # In WAL mode, NORMAL only syncs at checkpoints (still crash-safe);
+        # job progress updates don't need an fsync per commit
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
         try:
             yield conn
         finally:
@@ -172,6 +187,61 @@ class Database:
             ''', values)
             conn.commit()
 
+    def update_jobs_progress(self, progress_by_job: Dict[int, int]):
+        """
+        Update progress of several jobs in one transaction
+
+        Args:
+            progress_by_job: Mapping of job_id -> progress percentage
+        """
+        if not progress_by_job:
+            return
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                'UPDATE jobs SET progress = ?, updated_at = ? WHERE job_id = ?',
+                [(progress, now, job_id) for job_id, progress in progress_by_job.items()]
+            )
+            conn.commit()
+
+    def save_job_logs(self, logs_by_job: Dict[int, str]):
+        """
+        Store the log text of several jobs in one transaction
+
+        Args:
+            logs_by_job: Mapping of job_id -> log text
+        """
+        if not logs_by_job:
+            return
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                'UPDATE jobs SET log_text = ?, updated_at = ? WHERE job_id = ?',
+                [(log_text, now, job_id) for job_id, log_text in logs_by_job.items()]
+            )
+            conn.commit()
+
+    def finish_jobs(self, updates: List[Tuple[int, str, Optional[str], Optional[str]]]):
+        """
+        Set the final status of several jobs in one transaction
+
+        Args:
+            updates: (job_id, status, error_text, log_text) tuples. None keeps
+                     the current error_text/log_text, like update_job.
+        """
+        if not updates:
+            return
+        now = datetime.utcnow().isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                'UPDATE jobs SET status = ?, error_text = COALESCE(?, error_text), '
+                'log_text = COALESCE(?, log_text), finished_at = ?, updated_at = ? '
+                'WHERE job_id = ?',
+                [(status, error_text, log_text, now, now, job_id)
+                 for job_id, status, error_text, log_text in updates]
+            )
+            conn.commit()
+
     def get_job(self, job_id: int) -> Optional[Dict]:
         """Get job by ID"""
         with self._get_connection() as conn:
@@ -183,6 +253,29 @@ class Database:
                 return self._row_to_dict(row)
             return None
 
+    def get_job_by_download_token(self, download_token: str) -> Optional[Dict]:
+        """
+        Get the download fields of a job by zip download token
+
+        Only reads columns held in idx_jobs_download_token, so the lookup is
+        served from the index alone.
+
+        Returns:
+            dict with download_token, status, zip_path and zip_filename, or None
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT download_token, status, zip_path, zip_filename '
+                'FROM jobs WHERE download_token = ? LIMIT 1',
+                (download_token,)
+            )
+            row = cursor.fetchone()
+
+            if row:
+                return dict(row)
+            return None
+
     def list_jobs(
         self,
         status: Optional[str] = None,
@@ -278,6 +371,25 @@ class Database:
             rows = cursor.fetchall()
             return [self._row_to_dict(row) for row in rows]
 
+    def list_aborted_src_paths(self, prefix: str) -> List[str]:
+        """
+        Source paths under prefix of all failed and interrupted jobs
+
+        Args:
+            prefix: Path prefix to match (compared literally, not as a LIKE pattern)
+
+        Returns:
+            List of src_path values, one per matching job
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT src_path FROM jobs
+                WHERE status IN ('failed', 'interrupted')
+                AND substr(src_path, 1, ?) = ?
+            ''', (len(prefix), prefix))
+            return [row[0] for row in cursor.fetchall()]
+
     def list_interrupted_resumable_jobs(self, limit: int = 100, offset: int = 0) -> List[Dict]:
         """List interrupted jobs that haven't been resumed yet"""
         with self._get_connection() as conn:
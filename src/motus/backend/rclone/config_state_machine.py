@@ -76,7 +76,8 @@ class RcloneConfigStateMachine:
 
             # Parse JSON response
             response = json.loads(result.stdout)
-            logging.debug(f"rclone response: {json.dumps(response, indent=2)}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"rclone response: {json.dumps(response, indent=2)}")
 
             return True, response, None
 
@@ -126,7 +127,8 @@ class RcloneConfigStateMachine:
         if self.rclone_config_file:
             command.extend(['--config', self.rclone_config_file])
 
-        logging.info(f"Continuing rclone config: state={state}, result={result[:50]}...")
+        # The answer can be a secret (OAuth token, password), so only its size is logged
+        logging.info(f"Continuing rclone config: state={state}, result=<{len(result)} chars>")
 
         try:
             process_result = subprocess.run(
@@ -142,7 +144,8 @@ class RcloneConfigStateMachine:
 
             # Parse JSON response
             response = json.loads(process_result.stdout)
-            logging.debug(f"rclone response: {json.dumps(response, indent=2)}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(f"rclone response: {json.dumps(response, indent=2)}")
 
             # Check for errors in response
             if response.get('Error'):
@@ -205,7 +205,7 @@ class CustomRemoteCreationManager:
             current_response = session['current_response']
             current_state = current_response.get('State', '')
 
-            logging.info(f"Continuing creation for '{remote_name}' with answer: {answer}")
+            logging.info(f"Continuing creation for '{remote_name}' at state {current_state}")
 
             # Continue the flow
             success, next_response, error = state_machine.continue_flow(
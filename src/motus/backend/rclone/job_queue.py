@@ -26,6 +26,11 @@ class JobQueue:
         self._job_exitstatus = {}
         self._stop_events = {}  # job_id -> threading.Event
         self._processes = {}  # job_id -> subprocess.Popen
+        self._generation = 0  # bumped whenever a job starts or finishes
+        self._generation_lock = threading.Lock()  # guards _generation and _running_cache
+        self._running_cache = (-1, [])  # (generation, running job IDs)
+        self._versions = {}  # job_id -> bumped whenever the job's state changes
+        self._updates = threading.Condition()  # notified on every version bump
 
     def push(self, command, env, job_id):
         """Start a new job in background"""
@@ -33,6 +38,7 @@ class JobQueue:
             raise KeyError(f"Job with ID {job_id} already exists")
 
         self._stop_events[job_id] = threading.Event()
+        self._bump_generation()
 
         # Start job in background thread
         thread = threading.Thread(
@@ -44,6 +50,47 @@ class JobQueue:
 
         return job_id
 
+    @property
+    def generation(self):
+        """Counter that changes whenever a job starts or finishes"""
+        return self._generation
+
+    def _bump_generation(self):
+        """
+        Record that a job started or finished
+
+        Call only after the change is visible (process registered, stop
+        event set), so a recomputed running list always includes it.
+        """
+        with self._generation_lock:
+            self._generation += 1
+
+    def get_version(self, job_id):
+        """Counter that changes whenever the job's progress, text or state changes"""
+        return self._versions.get(job_id, 0)
+
+    def wait_for_update(self, job_id, version, timeout):
+        """
+        Block until the job's state changes
+
+        Args:
+            job_id: Job to wait for
+            version: Version the caller last saw (from get_version or a previous call)
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Current version (equal to version if the wait timed out)
+        """
+        with self._updates:
+            self._updates.wait_for(lambda: self._versions.get(job_id, 0) != version, timeout)
+            return self._versions.get(job_id, 0)
+
+    def _notify(self, job_id):
+        """Record a state change for a job and wake its waiters"""
+        with self._updates:
+            self._versions[job_id] = self._versions.get(job_id, 0) + 1
+            self._updates.notify_all()
+
     def get_text(self, job_id):
         """Get formatted status text for a job"""
         return self._job_text.get(job_id, '')
@@ -66,6 +113,8 @@ class JobQueue:
                     self._processes[job_id].terminate()
                 except:
                     pass
+            self._bump_generation()
+            self._notify(job_id)
 
     def is_finished(self, job_id):
         """Check if job has finished"""
@@ -77,6 +126,25 @@ class JobQueue:
         """Get exit status of job (-1 if not finished)"""
         return self._job_exitstatus.get(job_id, -1)
 
+    def get_status(self, job_id):
+        """
+        Get a consistent snapshot of a job's state
+
+        The finished flag is read first: the exit status and remaining stderr
+        are recorded before it is set, so a finished snapshot is complete.
+
+        Returns:
+            dict with finished, exit_status, percent, text and error_text
+        """
+        finished = self.is_finished(job_id)
+        return {
+            'finished': finished,
+            'exit_status': self.get_exitstatus(job_id),
+            'percent': self.get_percent(job_id),
+            'text': self.get_text(job_id),
+            'error_text': self.get_error_text(job_id),
+        }
+
     def delete(self, job_id):
         """Delete a job's data"""
         self._job_status.pop(job_id, None)
@@ -86,17 +154,33 @@ class JobQueue:
         self._job_exitstatus.pop(job_id, None)
         self._stop_events.pop(job_id, None)
         self._processes.pop(job_id, None)
+        with self._updates:
+            self._versions.pop(job_id, None)
 
     def get_running_jobs(self):
-        """Get list of running job IDs"""
-        running = []
-        all_jobs = list(self._processes.keys())
-        for job_id in all_jobs:
-            is_fin = self.is_finished(job_id)
-            if not is_fin:
-                running.append(job_id)
-        logging.debug(f"get_running_jobs: all_jobs={all_jobs}, running={running}")
-        return running
+        """
+        Get list of running job IDs
+
+        The list only changes when the generation does, so it is recomputed
+        only then (the idle timer and health checks call this repeatedly).
+        """
+        # Held while computing: a job changing state bumps the generation
+        # only after the change, so the cached list can't miss it
+        with self._generation_lock:
+            generation = self._generation
+            cached_generation, running = self._running_cache
+            if cached_generation == generation:
+                return list(running)
+
+            running = []
+            all_jobs = list(self._processes.keys())
+            for job_id in all_jobs:
+                is_fin = self.is_finished(job_id)
+                if not is_fin:
+                    running.append(job_id)
+            logging.debug(f"get_running_jobs: all_jobs={all_jobs}, running={running}")
+            self._running_cache = (generation, running)
+            return list(running)
 
     def shutdown_all(self):
         """Stop all running jobs (for graceful shutdown)"""
@@ -127,12 +211,15 @@ class JobQueue:
                 stderr=subprocess.PIPE,
             )
             self._processes[job_id] = process
+            self._bump_generation()
             logging.info(f"Job {job_id}: Started process PID {process.pid}")
         except Exception as e:
             logging.error(f"Failed to start job {job_id}: {e}")
             self._job_error_text[job_id] = str(e)
             self._job_exitstatus[job_id] = -1
             stop_event.set()
+            self._bump_generation()
+            self._notify(job_id)
             return
 
         # Motuz uses specific ANSI reset sequences
@@ -172,6 +259,7 @@ class JobQueue:
                 logging.error(f"Job {job_id}: {error}")
                 self._job_error_text[job_id] += error + '\n'
                 self._job_error_text[job_id] = self._job_error_text[job_id][-10000:]
+                self._notify(job_id)
                 continue
 
             # Parse status line key-value pairs
@@ -184,6 +272,7 @@ class JobQueue:
             key, value = status_match.groups()
             self._job_status[job_id][key] = value
             self._process_status(job_id)
+            self._notify(job_id)
 
         # Job finished - set to 100%
         self._job_percent[job_id] = 100
@@ -205,6 +294,8 @@ class JobQueue:
 
         logging.info(f"Job {job_id}: Copy process exited with exit status {exitstatus}")
         stop_event.set()
+        self._bump_generation()
+        self._notify(job_id)
 
     def _process_status(self, job_id):
         """Process status dict into formatted text and percentage (Motuz-style)"""
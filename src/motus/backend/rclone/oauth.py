@@ -8,6 +8,13 @@ import threading
 import time
 from typing import Dict, Optional, Tuple
 
+from .config_state_machine import RcloneConfigStateMachine
+
+# "rclone authorize" command in the oauth-authorize help text, with or
+# without the base64 config blob argument
+_AUTHORIZE_WITH_BLOB_RE = re.compile(r'rclone authorize "([^"]+)" "([^"]+)"')
+_AUTHORIZE_RE = re.compile(r'rclone authorize "([^"]+)"')
+
 
 def is_oauth_remote(remote_config: Dict[str, str]) -> bool:
     """
@@ -63,8 +70,6 @@ class OAuthRefreshManager:
             - message: Error or success message
             - state: Current state (for continuing flow)
         """
-        from .config_state_machine import RcloneConfigStateMachine
-
         # Clean up any old session
         with self._lock:
             if remote_name in self._active_sessions:
@@ -109,8 +114,6 @@ class OAuthRefreshManager:
         Returns:
             Dict with status and message
         """
-        from .config_state_machine import RcloneConfigStateMachine
-
         with self._lock:
             if remote_name not in self._active_sessions:
                 return {
@@ -202,16 +205,15 @@ class OAuthRefreshManager:
             # Parse the command from help text
             # Example 1: "rclone authorize \"onedrive\""
             # Example 2: "rclone authorize \"onedrive\" \"BASE64_STRING\""
-            import re
             # Try matching with both arguments first
-            match = re.search(r'rclone authorize "([^"]+)" "([^"]+)"', help_text)
+            match = _AUTHORIZE_WITH_BLOB_RE.search(help_text)
             if match:
                 provider = match.group(1)
                 config_blob = match.group(2)
                 authorize_command = f'rclone authorize "{provider}" "{config_blob}"'
             else:
                 # Try matching with just provider (single argument)
-                match = re.search(r'rclone authorize "([^"]+)"', help_text)
+                match = _AUTHORIZE_RE.search(help_text)
                 if match:
                     provider = match.group(1)
                     authorize_command = f'rclone authorize "{provider}"'
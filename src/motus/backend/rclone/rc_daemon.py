@@ -0,0 +1,196 @@
+"""
+Long-lived rclone remote control daemon (rclone rcd)
+
+Running one rcd process and talking to it over HTTP avoids paying the
+fork/exec and config parsing cost of a fresh rclone process for every
+short operation (ls, mkdir, delete, size) and file read.
+"""
+import logging
+import os
+import secrets
+import socket
+import subprocess
+import time
+from typing import Dict, Optional
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .exceptions import RcloneException
+
+
+class RcloneDaemon:
+    """Manages an `rclone rcd` process bound to localhost"""
+
+    def __init__(self, rclone_path: str, config_file: Optional[str] = None):
+        """
+        Initialize daemon settings (the process is started by start())
+
+        Args:
+            rclone_path: Path to rclone executable
+            config_file: rclone config file the daemon should use
+        """
+        self.rclone_path = rclone_path
+        self.config_file = config_file
+        self.url = None
+        self._auth = (f"motus-{secrets.token_hex(4)}", secrets.token_urlsafe(24))
+        self._process = None
+
+        # Keep-alive connections to the daemon, shared by all request threads.
+        # Retries only cover connection failures: POST bodies are never resent
+        # after the daemon has read them.
+        self._session = requests.Session()
+        self._session.auth = self._auth
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self._session.mount('http://', adapter)
+
+    @staticmethod
+    def _find_free_port() -> int:
+        """Ask the OS for a free TCP port on localhost"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start(self, timeout: float = 10) -> bool:
+        """
+        Start rclone rcd and wait until it answers
+
+        Args:
+            timeout: Seconds to wait for the daemon to become ready
+
+        Returns:
+            True if the daemon is running, False if it could not be started
+        """
+        port = self._find_free_port()
+        command = [
+            self.rclone_path,
+            'rcd',
+            '--rc-addr', f'127.0.0.1:{port}',
+            '--rc-serve',  # GET /[fs]/path streams file contents
+        ]
+        if self.config_file:
+            command.extend(['--config', self.config_file])
+
+        try:
+            # Credentials go through the environment: the command line is
+            # readable by every local user (ps, /proc/<pid>/cmdline)
+            self._process = subprocess.Popen(
+                command,
+                env={**os.environ, 'RCLONE_RC_USER': self._auth[0], 'RCLONE_RC_PASS': self._auth[1]},
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception as e:
+            logging.warning(f"Could not start rclone rcd: {e}")
+            return False
+
+        self.url = f'http://127.0.0.1:{port}'
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                logging.warning(f"rclone rcd exited with status {self._process.returncode}")
+                self.stop()
+                return False
+            try:
+                self.call('rc/noop', timeout=1)
+                logging.info(f"rclone rcd listening on {self.url} (PID {self._process.pid})")
+                return True
+            except RcloneException:
+                time.sleep(0.1)
+
+        logging.warning("rclone rcd did not become ready in time")
+        self.stop()
+        return False
+
+    def is_running(self) -> bool:
+        """Check if the daemon process is alive"""
+        return self._process is not None and self._process.poll() is None
+
+    def call(self, method: str, params: Optional[Dict] = None, timeout: float = 300) -> Dict:
+        """
+        Call an rc method
+
+        Args:
+            method: rc method name (e.g., 'operations/list')
+            params: JSON parameters for the method
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            RcloneException: If the daemon is unreachable or the call fails
+        """
+        if self.url is None:
+            raise RcloneException("rclone rcd is not running")
+
+        try:
+            response = self._session.post(
+                f'{self.url}/{method}',
+                json=params or {},
+                timeout=timeout,
+            )
+        except requests.RequestException as e:
+            raise RcloneException(f"rclone rcd request failed: {e}")
+
+        try:
+            result = response.json()
+        except ValueError:
+            result = {}
+
+        if response.status_code != 200:
+            raise RcloneException(result.get('error') or f"rc call {method} failed with HTTP {response.status_code}")
+
+        return result
+
+    def open(self, fs: str, remote: str, timeout: float = 300) -> requests.Response:
+        """
+        Open a file for streaming through the daemon's --rc-serve endpoint
+
+        Args:
+            fs: rclone fs string (e.g., 'myS3:/' or an on-the-fly ':s3,...:' remote)
+            remote: Path of the file within fs
+            timeout: Connect/read timeout in seconds
+
+        Returns:
+            Streaming response; iterate iter_content() and close() it when done
+
+        Raises:
+            RcloneException: If the daemon is unreachable or the file can't be read
+        """
+        if self.url is None:
+            raise RcloneException("rclone rcd is not running")
+
+        url = f"{self.url}/[{quote(fs, safe='')}]/{quote(remote)}"
+        try:
+            response = self._session.get(url, stream=True, timeout=timeout)
+        except requests.RequestException as e:
+            raise RcloneException(f"rclone rcd request failed: {e}")
+
+        if response.status_code != 200:
+            response.close()
+            raise RcloneException(f"Could not read {remote}: HTTP {response.status_code}")
+
+        return response
+
+    def stop(self):
+        """Terminate the daemon process"""
+        process, self._process = self._process, None
+        self.url = None
+        self._session.close()
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.terminate()
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        except Exception as e:
+            logging.debug(f"Error stopping rclone rcd: {e}")
@@ -5,9 +5,13 @@ import os
 import re
 import ast
 import logging
+import shutil
 from typing import Dict, List, Optional, Tuple
 from configparser import ConfigParser, DEFAULTSECT
 
+# [remote_name] section header line
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]')
+
 
 def markdown_links_to_html(text: str) -> str:
     """
@@ -58,6 +62,9 @@ class RcloneConfig:
             self.config_file = config_file
 
         self.parser = ConfigParser()
+        self._parsed_stat = None  # (st_mtime_ns, st_size) of the file last parsed
+        self.generation = 0  # Incremented each time the file is (re-)parsed
+        self._raw_index = None  # ((st_mtime_ns, st_size), {name: raw section text})
 
         # Create user config file if it doesn't exist
         if not os.path.exists(config_file):
@@ -72,11 +79,30 @@ class RcloneConfig:
             # Read user config directly
             self.reload()
 
-    def reload(self):
-        """Reload configuration from file"""
+    def reload(self, force: bool = False):
+        """
+        Reload configuration from file
+
+        The file is only re-parsed when its mtime or size changed since the
+        last load, so frequent calls (e.g. on every remotes listing) are cheap.
+
+        Args:
+            force: Re-parse even if the file looks unchanged (used after writes)
+        """
+        try:
+            st = os.stat(self.config_file)
+            file_stat = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            file_stat = None
+
+        if not force and file_stat is not None and file_stat == self._parsed_stat:
+            return
+
         self.parser = ConfigParser()
-        if os.path.exists(self.config_file):
+        if file_stat is not None:
             self.parser.read(self.config_file)
+        self._parsed_stat = file_stat
+        self.generation += 1
 
     def _create_merged_config(self):
         """
@@ -85,16 +111,13 @@ class RcloneConfig:
         User's remotes take precedence. Readonly remotes with duplicate names are ignored.
         This method is called on initialization and after user config modifications.
         """
-        import shutil
-        from configparser import ConfigParser
-
         # Start with a copy of user's config
         shutil.copy2(self.user_config_file, self.merged_config_file)
         logging.info(f"Created merged config at {self.merged_config_file}")
 
         # If no readonly config, we're done
         if not self.readonly_config_file or not os.path.exists(self.readonly_config_file):
-            self.reload()
+            self.reload(force=True)
             return
 
         # Load user config to check for duplicates
@@ -127,7 +150,7 @@ class RcloneConfig:
                     logging.info(f"Added readonly remote '{section}' to merged config")
 
         # Reload merged config into parser
-        self.reload()
+        self.reload(force=True)
         logging.info(
             f"Merged config created: {len(user_remotes)} user remotes, "
             f"{len(self.readonly_remotes)} readonly remotes"
@@ -190,65 +213,72 @@ class RcloneConfig:
         Returns:
             Raw config text including comments and the [name] line, or None if not found
         """
-        if not os.path.exists(self.config_file):
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
             return None
 
-        with open(self.config_file, 'r') as f:
-            lines = f.readlines()
+        # Sections are indexed in one pass and reused until the file changes
+        file_stat = (st.st_mtime_ns, st.st_size)
+        raw_index = self._raw_index
+        if raw_index is None or raw_index[0] != file_stat:
+            with open(self.config_file, 'r') as f:
+                raw_index = (file_stat, self._index_raw_sections(f.readlines()))
+            self._raw_index = raw_index
 
-        # Find the section
-        section_pattern = re.compile(r'^\[([^\]]+)\]')
-        in_section = False
-        section_start = -1
+        return raw_index[1].get(name)
+
+    @staticmethod
+    def _index_raw_sections(lines: List[str]) -> Dict[str, str]:
+        """
+        Split config file lines into the raw text of each section
+
+        A section's text starts with the comment lines directly above its
+        [name] line and runs until the next section header or the first line
+        that is neither blank, a comment nor a key = value pair. If a name
+        appears twice, the first section wins.
+
+        Args:
+            lines: Lines of the config file (with line endings)
+
+        Returns:
+            Dict mapping remote name -> raw config text (without trailing newline)
+        """
+        sections = {}
+        current = None  # Name of the section being collected
         section_lines = []
-        comment_lines = []
+        comment_lines = []  # Comments that may belong to the next section
 
-        for i, line in enumerate(lines):
+        def finish():
+            if current is not None and current not in sections:
+                sections[current] = ''.join(section_lines).rstrip('\n')
+
+        for line in lines:
             stripped = line.strip()
 
-            # Check for section header
-            match = section_pattern.match(stripped)
+            match = _SECTION_RE.match(stripped)
             if match:
-                if in_section:
-                    # End of our section
-                    break
-                elif match.group(1) == name:
-                    # Start of our section
-                    in_section = True
-                    section_start = i
-                    # Include preceding comment lines
-                    section_lines = comment_lines + [line]
-                    comment_lines = []
-                    continue
-                else:
-                    # Different section, reset comment buffer
-                    comment_lines = []
-                    continue
+                finish()
+                current = match.group(1)
+                section_lines = comment_lines + [line]
+                comment_lines = []
+                continue
 
-            if in_section:
-                # We're in the target section
-                if stripped == '' or stripped.startswith('#'):
-                    # Empty line or comment within section
-                    section_lines.append(line)
-                elif '=' in line:
-                    # Config line
+            if current is not None:
+                if stripped == '' or stripped.startswith('#') or '=' in line:
                     section_lines.append(line)
                 else:
                     # Probably end of section (or malformed line)
-                    break
-            elif stripped.startswith('#'):
-                # Comment before any section - might belong to next section
-                comment_lines.append(line)
-            else:
-                # Not in section and not a comment - reset comment buffer
-                if stripped != '':
-                    comment_lines = []
+                    finish()
+                    current = None
 
-        if not section_lines:
-            return None
+            if stripped.startswith('#'):
+                comment_lines.append(line)
+            elif stripped != '':
+                comment_lines = []
 
-        # Join and remove trailing newline
-        return ''.join(section_lines).rstrip('\n')
+        finish()
+        return sections
 
     def update_remote_raw(self, old_name: str, new_config_text: str) -> Tuple[bool, Optional[str]]:
         """
@@ -277,7 +307,7 @@ class RcloneConfig:
 
         # Parse the new config to extract the new name
         new_name = None
-        section_pattern = re.compile(r'^\[([^\]]+)\]')
+        section_pattern = _SECTION_RE
         for line in new_config_text.split('\n'):
             match = section_pattern.match(line.strip())
             if match:
@@ -368,7 +398,7 @@ class RcloneConfig:
         self._regenerate_merged_config()
 
         # Reload parser
-        self.reload()
+        self.reload(force=True)
 
         logging.info(f"Updated remote {old_name} -> {new_name} in-place")
         return True, new_name
@@ -384,7 +414,7 @@ class RcloneConfig:
             Tuple of (success: bool, remote_name: Optional[str])
         """
         # Parse to extract remote name
-        section_pattern = re.compile(r'^\[([^\]]+)\]')
+        section_pattern = _SECTION_RE
         remote_name = None
         for line in raw_config_text.split('\n'):
             match = section_pattern.match(line.strip())
@@ -425,7 +455,7 @@ class RcloneConfig:
         # Regenerate merged config if needed
         self._regenerate_merged_config()
 
-        self.reload()
+        self.reload(force=True)
         logging.info(f"Added new remote {remote_name} from raw config")
         return True, remote_name
 
@@ -529,13 +559,11 @@ class RcloneConfig:
         Raises:
             FileNotFoundError: If source_config_file doesn't exist
         """
-        import configparser
-
         if not os.path.exists(source_config_file):
             raise FileNotFoundError(f"Source config file not found: {source_config_file}")
 
         # Parse source config file
-        source_parser = configparser.ConfigParser()
+        source_parser = ConfigParser()
         source_parser.read(source_config_file)
 
         # Get existing remotes
@@ -651,14 +679,15 @@ class RemoteTemplate:
 
         Args:
             template_file: Path to template file
+
+        Raises:
+            FileNotFoundError: If template_file does not exist
         """
         self.template_file = template_file
         self.templates: Dict[str, Dict[str, any]] = {}
 
-        if template_file and os.path.exists(template_file):
+        if template_file:
             self.load()
-        else:
-            logging.warning(f"Template file not found: {template_file}")
 
     def load(self):
         """Load templates from file"""
@@ -3,18 +3,26 @@ Rclone wrapper for single-user file operations
 Adapted from Motuz (MIT License) - FredHutch/motuz
 Simplified for single-user, no authentication needed
 """
+import atexit
 import json
 import logging
 import os
+import secrets
 import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+import zipfile
 from typing import Dict, List, Optional
 
+from ..cache import TTLCache, fingerprint
+from ..config import Config
+from ..models import Database
 from .exceptions import RcloneException, RcloneNotFoundError
 from .job_queue import JobQueue
+from .rc_daemon import RcloneDaemon
 from .rclone_config import RcloneConfig
 
 # Cross-platform null device
@@ -25,12 +33,19 @@ def safe_remove(path):
     """
     Safely remove a file or directory
 
-    Handles both files and directories (recursively)
+    Handles both files and directories (recursively). Files are removed
+    without a prior stat; a missing path is not an error.
     """
-    if os.path.isdir(path):
-        shutil.rmtree(path)
-    else:
+    try:
         os.remove(path)
+    except IsADirectoryError:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        pass
+
+
+# Cache miss marker for resolve_to_local_path (None is a valid result)
+_UNRESOLVED = object()
 
 
 class RcloneWrapper:
@@ -39,6 +54,17 @@ class RcloneWrapper:
     Supports local filesystem and cloud backends (S3, SFTP, etc.)
     """
 
+    def _download_cache_dir(self) -> str:
+        """
+        Directory for download ZIPs and their temp/ copies
+
+        Derived from the cache_dir the app passed in, so it matches the app's
+        download_cache_dir under --cache-dir, --data-dir or a config file.
+        """
+        if self.cache_dir:
+            return os.path.join(self.cache_dir, 'download')
+        return Config().download_cache_dir
+
     def __init__(self, rclone_path: str = None, rclone_config_file: str = None, logs_dir: str = None,
                  readonly_config_file: str = None, cache_dir: str = None):
         """
@@ -49,7 +75,7 @@ class RcloneWrapper:
             rclone_config_file: Path to rclone config file (default: rclone default)
             logs_dir: Directory to store job log files (default: None, logging disabled)
             readonly_config_file: Path to readonly remotes config file (from --extra-remotes)
-            cache_dir: Cache directory for merged config file
+            cache_dir: Cache directory for merged config file and download files
         """
         self.rclone_path = rclone_path or self._find_rclone()
         self.rclone_config_file = rclone_config_file
@@ -82,6 +108,19 @@ class RcloneWrapper:
             cache_dir=self.cache_dir
         )
 
+        # Long-lived rcd process for short operations (ls, mkdir, delete, size)
+        # Falls back to one rclone process per call if it cannot be started
+        self._daemon = RcloneDaemon(self.rclone_path, self.rclone_config.config_file)
+        self._daemon_config_mtime = self._config_mtime()
+        self._connection_strings = {}  # remote_config fingerprint -> rc fs prefix
+
+        # path -> resolve_to_local_path() result; dropped when the config file changes
+        self._resolve_cache = TTLCache(maxsize=4096, ttl=30)
+        self._resolve_config_mtime = self._daemon_config_mtime
+        if not self._daemon.start():
+            logging.warning("rclone rcd unavailable, running rclone per operation")
+        atexit.register(self._daemon.stop)
+
     def initialize_job_counter(self, db):
         """
         Initialize job ID counter from database to avoid UNIQUE constraint errors
@@ -221,6 +260,23 @@ class RcloneWrapper:
         if ':' not in path:
             return path
 
+        # Resolution only depends on the rclone config, so reuse earlier
+        # results until the config file changes (avoids re-parsing it per call)
+        mtime = self._config_mtime()
+        if mtime != self._resolve_config_mtime:
+            self._resolve_cache.clear()
+            self._resolve_config_mtime = mtime
+
+        cached = self._resolve_cache.get(path, _UNRESOLVED)
+        if cached is not _UNRESOLVED:
+            return cached
+
+        local_path = self._resolve_remote_to_local_path(path)
+        self._resolve_cache.set(path, local_path)
+        return local_path
+
+    def _resolve_remote_to_local_path(self, path: str) -> Optional[str]:
+        """Uncached alias chain resolution for a 'remote:path' string (see resolve_to_local_path)"""
         # Parse the path to extract remote and path components
         remote_name, remote_path = path.split(':', 1)
 
@@ -306,6 +362,94 @@ class RcloneWrapper:
             expanded = expanded.rstrip('/').rstrip('\\')
         return (None, expanded)
 
+    def _config_mtime(self) -> float:
+        """Get modification time of the active rclone config file (0 if missing)"""
+        try:
+            return os.path.getmtime(self.rclone_config.config_file)
+        except (OSError, TypeError):
+            return 0
+
+    def _connection_string(self, remote_config: Dict) -> str:
+        """
+        Build an on-the-fly rclone remote (':type,key=value:') from a legacy remote_config
+
+        Results are cached per remote_config fingerprint so repeated calls
+        with the same credentials reuse the daemon's backend instance.
+        """
+        key = fingerprint(remote_config)
+        connection = self._connection_strings.get(key)
+        if connection is None:
+            prefix = 'RCLONE_CONFIG_CURRENT_'
+            options = []
+            for env_key, value in self._format_credentials(remote_config, 'current').items():
+                option = env_key[len(prefix):].lower()
+                if option != 'type':
+                    escaped = value.replace('"', '""')
+                    options.append(f'{option}="{escaped}"')
+            if remote_config['type'] == 's3':
+                # Same options the CLI mkdir passes for legacy S3 configs
+                options.extend(['no_check_bucket=true', 'acl=bucket-owner-full-control'])
+            connection = ':' + ','.join([remote_config['type']] + options) + ':'
+            self._connection_strings[key] = connection
+        return connection
+
+    def _rc_target(self, path: str, remote_config: Optional[Dict] = None) -> Optional[tuple]:
+        """
+        Split a path into the (fs, remote) pair used by rc operations
+
+        Args:
+            path: Path (local or remote syntax)
+            remote_config: Optional remote configuration dict (legacy support)
+
+        Returns:
+            Tuple of (fs, remote), or None if the call must go through the rclone CLI
+            Examples:
+                'myS3:/bucket/dir' -> ('myS3:/', 'bucket/dir')
+                'sftp:docs' -> ('sftp:', 'docs')
+                '/local/path' -> ('/', 'local/path')
+                '/bucket/dir' + s3 remote_config -> (':s3,...:/', 'bucket/dir')
+        """
+        if not self._daemon.is_running():
+            return None
+
+        remote_name, clean_path = self._parse_path(path)
+
+        if remote_name:
+            root = f"{remote_name}:"
+        elif remote_config:
+            root = self._connection_string(remote_config)
+            clean_path = path
+        elif sys.platform == 'win32' or not os.path.isabs(clean_path):
+            return None
+        else:
+            root = ''
+
+        if clean_path.startswith('/'):
+            return f"{root}/", clean_path.strip('/')
+        return root, clean_path.rstrip('/')
+
+    def _refresh_daemon_config(self):
+        """Clear the daemon's backend cache if the config file changed, so edited remotes are picked up"""
+        mtime = self._config_mtime()
+        if mtime != self._daemon_config_mtime:
+            self._daemon.call('fscache/clear')
+            self._daemon_config_mtime = mtime
+
+    def _rc_call(self, method: str, params: Dict) -> Dict:
+        """
+        Call an rc method on the daemon
+
+        Clears the daemon's backend cache first if the config file changed,
+        so edited remotes are picked up.
+        """
+        self._refresh_daemon_config()
+        fs = params.get('fs', '')
+        if fs.startswith(':'):
+            # On-the-fly remotes embed credentials; only log the backend type
+            fs = fs.split(',', 1)[0].rstrip(':') + ':' + fs.rsplit(':', 1)[-1]
+        logging.info(f"rc: {method} {fs}{params.get('remote', '')}")
+        return self._daemon.call(method, params)
+
     def ls(self, path: str, remote_config: Optional[Dict] = None) -> List[Dict]:
         """
         List files and directories at path
@@ -318,6 +462,24 @@ class RcloneWrapper:
         Returns:
             List of file/directory dicts with 'Name', 'Size', 'IsDir', etc.
         """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            try:
+                result = self._rc_call('operations/list', {
+                    'fs': fs,
+                    'remote': remote,
+                    'opt': {'noMimeType': True},
+                })
+                files = result.get('list') or []
+                # Match lsjson output: Path is relative to the listed directory
+                for item in files:
+                    item['Path'] = item.get('Name', '')
+                return files
+            except RcloneException as e:
+                # rc cannot list a single file; let lsjson handle it (and report errors)
+                logging.debug(f"rc list failed for {path}, using lsjson: {e}")
+
         credentials = {}
         config_arg = self.rclone_config.config_file
 
@@ -365,6 +527,15 @@ class RcloneWrapper:
                   Examples: '/local/path', 'myS3:/bucket/path'
             remote_config: Optional remote configuration dict (legacy support)
         """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            try:
+                self._rc_call('operations/mkdir', {'fs': fs, 'remote': remote})
+                return
+            except RcloneException as e:
+                raise RcloneException(f"Failed to create directory {path}: {e}")
+
         credentials = {}
         config_arg = self.rclone_config.config_file
 
@@ -412,6 +583,7 @@ class RcloneWrapper:
         src_config: Optional[Dict] = None,
         dst_config: Optional[Dict] = None,
         copy_links: bool = False,
+        extra_args: Optional[List[str]] = None,
     ) -> int:
         """
         Copy files/directories (async, returns job_id)
@@ -422,6 +594,7 @@ class RcloneWrapper:
             src_config: Optional source remote config
             dst_config: Optional destination remote config
             copy_links: Follow symlinks
+            extra_args: Additional rclone flags (e.g., transfer tuning)
 
         Returns:
             job_id for tracking progress
@@ -432,7 +605,8 @@ class RcloneWrapper:
             dst_path,
             src_config,
             dst_config,
-            copy_links
+            copy_links,
+            extra_args
         )
 
     def move(
@@ -495,6 +669,16 @@ class RcloneWrapper:
         # Check if path is a directory or file
         is_dir = self._is_directory(path, remote_config)
 
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            try:
+                self._rc_call('operations/purge' if is_dir else 'operations/deletefile',
+                              {'fs': fs, 'remote': remote})
+                return
+            except RcloneException as e:
+                raise RcloneException(f"Failed to delete {path}: {e}")
+
         if is_dir:
             # It's a directory - use purge
             command = [self.rclone_path, '--config', config_arg if config_arg else DEVNULL, 'purge', remote_path]
@@ -660,6 +844,217 @@ class RcloneWrapper:
             False
         )
 
+    def stat(self, path: str, remote_config: Optional[Dict] = None,
+             mod_time: bool = False) -> Optional[Dict]:
+        """
+        Get metadata for a single file or directory without listing its parent
+
+        Args:
+            path: Path to check (local, remote syntax, or with remote_config)
+            remote_config: Optional remote configuration dict (legacy support)
+            mod_time: Include 'ModTime' (may cost an extra request on some backends)
+
+        Returns:
+            dict with 'Name', 'Size', 'IsDir', etc., or None if the path doesn't exist
+        """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            try:
+                result = self._rc_call('operations/stat', {
+                    'fs': fs,
+                    'remote': remote,
+                    'opt': {'noModTime': not mod_time, 'noMimeType': True},
+                })
+                return result.get('item')
+            except RcloneException as e:
+                logging.debug(f"rc stat failed for {path}, using lsjson --stat: {e}")
+
+        credentials = {}
+        config_arg = self.rclone_config.config_file
+
+        remote_name, clean_path = self._parse_path(path)
+
+        if remote_name:
+            remote_path = f"{remote_name}:{clean_path}"
+        elif remote_config:
+            credentials = self._format_credentials(remote_config, 'current')
+            remote_path = f"current:{path}"
+            config_arg = DEVNULL
+        else:
+            remote_path = clean_path
+
+        command = [
+            self.rclone_path,
+            '--config', config_arg if config_arg else DEVNULL,
+            'lsjson',
+            '--stat',
+            '--no-mimetype',
+        ]
+        if not mod_time:
+            command.append('--no-modtime')
+        command.append(remote_path)
+
+        self._log_command(command, credentials)
+
+        try:
+            return json.loads(self._execute(command, credentials))
+        except RcloneException as e:
+            if 'not found' in str(e):
+                return None
+            raise
+        except json.JSONDecodeError as e:
+            raise RcloneException(f"Failed to parse rclone output: {e}")
+
+    def list_files_recursive(self, path: str, remote_config: Optional[Dict] = None) -> List[Dict]:
+        """
+        List all files below a directory
+
+        Args:
+            path: Directory path (local, remote syntax, or with remote_config)
+            remote_config: Optional remote configuration dict (legacy support)
+
+        Returns:
+            List of file dicts; 'Path' is relative to the listed directory
+        """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            try:
+                result = self._rc_call('operations/list', {
+                    'fs': fs,
+                    'remote': remote,
+                    'opt': {'recurse': True, 'filesOnly': True, 'noMimeType': True},
+                    '_config': {'UseListR': True},  # --fast-list
+                })
+                files = result.get('list') or []
+                prefix = f"{remote}/" if remote else ''
+                for item in files:
+                    if prefix and item.get('Path', '').startswith(prefix):
+                        item['Path'] = item['Path'][len(prefix):]
+                return files
+            except RcloneException as e:
+                logging.debug(f"rc recursive list failed for {path}, using lsjson: {e}")
+
+        credentials = {}
+        config_arg = self.rclone_config.config_file
+
+        remote_name, clean_path = self._parse_path(path)
+
+        if remote_name:
+            remote_path = f"{remote_name}:{clean_path}"
+        elif remote_config:
+            credentials = self._format_credentials(remote_config, 'current')
+            remote_path = f"current:{path}"
+            config_arg = DEVNULL
+        else:
+            remote_path = clean_path
+
+        command = [
+            self.rclone_path,
+            '--config', config_arg if config_arg else DEVNULL,
+            'lsjson',
+            '-R',
+            '--files-only',
+            '--fast-list',
+            '--no-mimetype',
+            remote_path,
+        ]
+
+        self._log_command(command, credentials)
+
+        try:
+            return json.loads(self._execute(command, credentials))
+        except json.JSONDecodeError as e:
+            raise RcloneException(f"Failed to parse rclone output: {e}")
+
+    def cat(self, path: str, remote_config: Optional[Dict] = None) -> subprocess.Popen:
+        """
+        Start streaming a remote file's contents
+
+        Args:
+            path: File path (remote syntax or with remote_config)
+            remote_config: Optional remote configuration dict (legacy support)
+
+        Returns:
+            subprocess.Popen whose stdout yields the file contents.
+            The caller must read it and wait() for (or kill) the process.
+        """
+        credentials = {}
+        config_arg = self.rclone_config.config_file
+
+        remote_name, clean_path = self._parse_path(path)
+
+        if remote_name:
+            remote_path = f"{remote_name}:{clean_path}"
+        elif remote_config:
+            credentials = self._format_credentials(remote_config, 'current')
+            remote_path = f"current:{path}"
+            config_arg = DEVNULL
+        else:
+            remote_path = clean_path
+
+        command = [
+            self.rclone_path,
+            '--config', config_arg if config_arg else DEVNULL,
+            'cat',
+            remote_path,
+        ]
+
+        self._log_command(command, credentials)
+
+        full_env = os.environ.copy()
+        full_env.update(credentials)
+        return subprocess.Popen(
+            command,
+            env=full_env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def read_chunks(self, path: str, remote_config: Optional[Dict] = None, chunk_size: int = 256 * 1024):
+        """
+        Yield a file's contents in chunks
+
+        Served by the rcd daemon over HTTP when possible, so reading many
+        files does not start one rclone process each; falls back to rclone cat.
+
+        Args:
+            path: File path (local, remote syntax, or with remote_config)
+            remote_config: Optional remote configuration dict (legacy support)
+            chunk_size: Size of the yielded chunks in bytes
+
+        Raises:
+            RcloneException: If the file can't be read
+        """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            try:
+                self._refresh_daemon_config()
+                response = self._daemon.open(*rc_target)
+            except RcloneException as e:
+                logging.debug(f"rc read failed for {path}, using rclone cat: {e}")
+            else:
+                with response:
+                    yield from response.iter_content(chunk_size)
+                return
+
+        process = self.cat(path, remote_config)
+        try:
+            while True:
+                chunk = process.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            if process.wait() != 0:
+                error = process.stderr.read().decode('utf-8', 'replace').strip()
+                raise RcloneException(error or f"rclone cat exited with status {process.returncode}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
     def size(self, path: str, remote_config: Optional[Dict] = None) -> Dict:
         """
         Get size of a path (file or directory)
@@ -671,6 +1066,24 @@ class RcloneWrapper:
         Returns:
             dict: {'bytes': <size_in_bytes>, 'count': <file_count>}
         """
+        rc_target = self._rc_target(path, remote_config)
+        if rc_target:
+            fs, remote = rc_target
+            if remote:
+                fs = f"{fs.rstrip('/')}/{remote}" if fs.endswith('/') else f"{fs}{remote}"
+            try:
+                result = self._rc_call('operations/size', {
+                    'fs': fs,
+                    '_config': {'UseListR': True},  # --fast-list
+                })
+                return {
+                    'bytes': result.get('bytes', 0),
+                    'count': result.get('count', 0)
+                }
+            except RcloneException as e:
+                # rc cannot size a single file; let rclone size handle it
+                logging.debug(f"rc size failed for {path}, using rclone size: {e}")
+
         credentials = {}
         config_arg = self.rclone_config.config_file
 
@@ -693,6 +1106,7 @@ class RcloneWrapper:
             self.rclone_path,
             '--config', config_arg if config_arg else DEVNULL,
             'size',
+            '--fast-list',  # One recursive listing instead of one per directory where supported
             remote_path,
             '--json'
         ]
@@ -701,7 +1115,6 @@ class RcloneWrapper:
 
         try:
             output = self._execute(command, credentials)
-            import json
             result = json.loads(output)
             return {
                 'bytes': result.get('bytes', 0),
@@ -722,7 +1135,6 @@ class RcloneWrapper:
         Returns:
             str: Path to temporary file
         """
-        import tempfile
 
         credentials = {}
         config_arg = self.rclone_config.config_file
@@ -768,8 +1180,11 @@ class RcloneWrapper:
         self,
         paths: List[str],
         remote_config: Optional[Dict] = None,
-        estimated_size: int = 0,
-        db = None
+        estimated_size: Optional[int] = None,
+        db = None,
+        transfers: int = 32,
+        checkers: int = 64,
+        download_token: Optional[str] = None
     ) -> int:
         """
         Create a background job to zip files/folders for download
@@ -777,15 +1192,16 @@ class RcloneWrapper:
         Args:
             paths: List of paths to include in zip
             remote_config: Optional remote configuration
-            estimated_size: Estimated total size in bytes
+            estimated_size: Estimated total size in bytes (None if not computed)
             db: Database instance (required)
+            transfers: Parallel file transfers for staging remote data
+            checkers: Parallel checkers for staging remote data
+            download_token: Token the finished zip is served under
+                            (generated if not given)
 
         Returns:
             int: job_id for tracking progress
         """
-        import zipfile
-        import threading
-        import secrets
 
         if db is None:
             raise ValueError("Database instance is required for create_download_zip_job")
@@ -799,14 +1215,17 @@ class RcloneWrapper:
         zip_filename = f"download_{secrets.token_urlsafe(16)}.zip"
 
         # Get download cache directory
-        from ..config import Config
-        config = Config()  # This will use existing data_dir
-        cache_dir = config.download_cache_dir
+        cache_dir = self._download_cache_dir()
 
         zip_path = os.path.join(cache_dir, zip_filename)
 
         # Generate download token
-        download_token = secrets.token_urlsafe(32)
+        if download_token is None:
+            download_token = secrets.token_urlsafe(32)
+
+        # Staging copies are bulk remote -> local downloads, so run them wider
+        # than rclone's defaults (4 transfers / 8 checkers)
+        copy_args = self._download_copy_args(transfers, checkers)
 
         logging.info(f"Creating zip job {job_id} for {len(paths)} paths -> {zip_path}")
 
@@ -854,7 +1273,7 @@ class RcloneWrapper:
                                     logging.info(f"[Job {job_id}] Downloading remote file: {path}")
 
                                     # Phase 1 is handled inside _download_file_to_temp_with_progress
-                                    temp_path = self._download_file_to_temp_with_progress(path, job_id, remote_config)
+                                    temp_path = self._download_file_to_temp_with_progress(path, job_id, remote_config, copy_args)
                                     temp_items_to_cleanup.append(temp_path)
 
                                     # Phase 2: Compress to ZIP
@@ -877,7 +1296,7 @@ class RcloneWrapper:
                                     logging.info(f"[Job {job_id}] Downloading remote directory: {path}")
 
                                     # Phase 1 is handled inside _download_dir_to_temp_with_progress
-                                    temp_dir = self._download_dir_to_temp_with_progress(path, job_id, remote_config)
+                                    temp_dir = self._download_dir_to_temp_with_progress(path, job_id, remote_config, copy_args)
                                     temp_items_to_cleanup.append(temp_dir)
 
                                     # Phase 2: Compress to ZIP
@@ -940,7 +1359,6 @@ class RcloneWrapper:
                         if os.path.isfile(temp_item):
                             os.remove(temp_item)
                         elif os.path.isdir(temp_item):
-                            import shutil
                             shutil.rmtree(temp_item)
                     except Exception as e:
                         logging.warning(f"[Job {job_id}] Failed to cleanup temp item {temp_item}: {e}")
@@ -950,8 +1368,7 @@ class RcloneWrapper:
                 if current_job and current_job['status'] == 'interrupted':
                     logging.info(f"[Job {job_id}] Job was cancelled, cleaning up ZIP")
                     try:
-                        if os.path.exists(zip_path):
-                            safe_remove(zip_path)
+                        safe_remove(zip_path)
                     except Exception as e:
                         logging.warning(f"[Job {job_id}] Failed to cleanup cancelled ZIP: {e}")
                     return  # Don't mark as completed
@@ -974,11 +1391,10 @@ class RcloneWrapper:
                     error_text=str(e)
                 )
                 # Clean up partial zip
-                if os.path.exists(zip_path):
-                    try:
-                        safe_remove(zip_path)
-                    except:
-                        pass
+                try:
+                    safe_remove(zip_path)
+                except OSError:
+                    pass
 
         # Start worker thread
         thread = threading.Thread(target=zip_worker, daemon=True, name=f"ZipJob-{job_id}")
@@ -998,42 +1414,43 @@ class RcloneWrapper:
             True if it's a file, False if it's a directory
         """
         try:
-            remote_name, clean_path = self._parse_path(path)
-
-            # Get parent directory listing
-            parent_path = os.path.dirname(clean_path.rstrip('/'))
-            basename = os.path.basename(clean_path.rstrip('/'))
-
-            if not parent_path or parent_path == '.':
-                parent_path = '/'
-
-            if remote_name:
-                full_parent = f"{remote_name}:{parent_path}"
-            else:
-                full_parent = parent_path
-
-            # List parent directory
-            result = self.ls(full_parent, remote_config)
-
-            # Find the item in the listing
-            for item in result:
-                if item.get('Name') == basename:
-                    # Check if it's a file (has Size) or directory (IsDir=True)
-                    return not item.get('IsDir', False)
+            # Stat the path itself instead of listing its parent directory
+            item = self.stat(path, remote_config)
 
             # If not found, assume it's a directory
-            return False
+            return item is not None and not item.get('IsDir', False)
 
         except Exception as e:
             logging.warning(f"Could not determine if {path} is file: {e}")
             # Default to file for single items
             return True
 
+    @staticmethod
+    def _download_copy_args(transfers: int, checkers: int) -> List[str]:
+        """
+        Build rclone flags for bulk staging downloads
+
+        Args:
+            transfers: Number of parallel file transfers
+            checkers: Number of parallel checkers
+
+        Returns:
+            List of rclone command-line flags
+        """
+        return [
+            f'--transfers={transfers}',
+            f'--checkers={checkers}',
+            '--multi-thread-streams=8',
+            '--multi-thread-cutoff=64M',
+            '--use-mmap',
+        ]
+
     def _download_file_to_temp_with_progress(
         self,
         path: str,
         download_job_id: int,
-        remote_config: Optional[Dict] = None
+        remote_config: Optional[Dict] = None,
+        copy_args: Optional[List[str]] = None
     ) -> str:
         """
         Download a remote file to temp with full progress tracking
@@ -1045,6 +1462,7 @@ class RcloneWrapper:
             path: Remote file path
             download_job_id: The download job ID to update with progress
             remote_config: Optional remote configuration
+            copy_args: Additional rclone flags for the copy job
 
         Returns:
             str: Path to temporary file
@@ -1052,11 +1470,7 @@ class RcloneWrapper:
         Raises:
             RcloneException: If download fails or is interrupted
         """
-        import shutil
-        import time
 
-        from ..models import Database
-        from ..config import Config
 
         config = Config()
         db = Database(config.database_path)
@@ -1072,11 +1486,10 @@ class RcloneWrapper:
             raise RcloneException("_download_file_to_temp_with_progress requires a remote path")
 
         # Create temp file in cache directory (NOT /tmp)
-        temp_dir = os.path.join(config.download_cache_dir, 'temp')
+        temp_dir = os.path.join(self._download_cache_dir(), 'temp')
         os.makedirs(temp_dir, exist_ok=True)
 
         # Generate unique temp filename
-        import secrets
         temp_filename = f"download_temp_{secrets.token_urlsafe(8)}_{os.path.basename(clean_path) or 'file'}"
         temp_file = os.path.join(temp_dir, temp_filename)
 
@@ -1085,7 +1498,7 @@ class RcloneWrapper:
 
             # Create a regular rclone copy job (this gives us progress tracking)
             # Use the copy method which will use 'copyto' for single files
-            copy_job_id = self.copy(remote_path, temp_file, src_config=remote_config)
+            copy_job_id = self.copy(remote_path, temp_file, src_config=remote_config, extra_args=copy_args)
 
             # IMPORTANT: Create database entry for the copy job
             # (The copy() method doesn't create a DB entry when called internally)
@@ -1166,7 +1579,8 @@ class RcloneWrapper:
         self,
         path: str,
         download_job_id: int,
-        remote_config: Optional[Dict] = None
+        remote_config: Optional[Dict] = None,
+        copy_args: Optional[List[str]] = None
     ) -> str:
         """
         Download a remote directory to temp with full progress tracking
@@ -1178,6 +1592,7 @@ class RcloneWrapper:
             path: Remote directory path
             download_job_id: The download job ID to update with progress
             remote_config: Optional remote configuration
+            copy_args: Additional rclone flags for the copy job
 
         Returns:
             str: Path to temporary directory
@@ -1185,11 +1600,7 @@ class RcloneWrapper:
         Raises:
             RcloneException: If download fails or is interrupted
         """
-        import shutil
-        import time
 
-        from ..models import Database
-        from ..config import Config
 
         config = Config()
         db = Database(config.database_path)
@@ -1210,11 +1621,10 @@ class RcloneWrapper:
             remote_path += '/'
 
         # Create temp directory in cache (NOT /tmp)
-        temp_base_dir = os.path.join(config.download_cache_dir, 'temp')
+        temp_base_dir = os.path.join(self._download_cache_dir(), 'temp')
         os.makedirs(temp_base_dir, exist_ok=True)
 
         # Generate unique temp directory name
-        import secrets
         temp_dir_name = f"download_temp_{secrets.token_urlsafe(8)}"
         temp_dir = os.path.join(temp_base_dir, temp_dir_name)
         os.makedirs(temp_dir, exist_ok=True)
@@ -1223,7 +1633,7 @@ class RcloneWrapper:
             logging.info(f"[Job {download_job_id}] Starting rclone copy job for {path}")
 
             # Create a regular rclone copy job (this gives us progress tracking)
-            copy_job_id = self.copy(remote_path, temp_dir, src_config=remote_config)
+            copy_job_id = self.copy(remote_path, temp_dir, src_config=remote_config, extra_args=copy_args)
 
             # IMPORTANT: Create database entry for the copy job
             # (The copy() method doesn't create a DB entry when called internally)
@@ -1311,8 +1721,6 @@ class RcloneWrapper:
         Returns:
             str: Path to temporary directory
         """
-        import tempfile
-        import shutil
 
         credentials = {}
         config_arg = self.rclone_config.config_file
@@ -1369,23 +1777,8 @@ class RcloneWrapper:
             remote_name, clean_path = self._parse_path(path)
 
             if remote_name or remote_config:
-                # Remote path - try to get parent directory listing
-                parent_path = os.path.dirname(clean_path.rstrip('/'))
-                basename = os.path.basename(clean_path.rstrip('/'))
-
-                # Handle root directory
-                if not parent_path or parent_path == '.':
-                    parent_path = '/'
-
-                # Reconstruct full parent path
-                if remote_name:
-                    full_parent = f"{remote_name}:{parent_path}"
-                else:
-                    full_parent = parent_path
-
-                # List parent directory
-                files = self.ls(full_parent, remote_config)
-                return any(f['Name'] == basename for f in files)
+                # Remote path - stat the path itself (no parent listing)
+                return self.stat(path, remote_config) is not None
             else:
                 # Local path
                 return os.path.exists(clean_path)
@@ -1409,26 +1802,9 @@ class RcloneWrapper:
             remote_name, clean_path = self._parse_path(path)
 
             if remote_name or remote_config:
-                # Remote path - try to get parent directory listing
-                parent_path = os.path.dirname(clean_path.rstrip('/'))
-                basename = os.path.basename(clean_path.rstrip('/'))
-
-                # Handle root directory
-                if not parent_path or parent_path == '.':
-                    parent_path = '/'
-
-                # Reconstruct full parent path
-                if remote_name:
-                    full_parent = f"{remote_name}:{parent_path}"
-                else:
-                    full_parent = parent_path
-
-                # List parent directory
-                files = self.ls(full_parent, remote_config)
-                for f in files:
-                    if f['Name'] == basename:
-                        return f.get('IsDir', False)
-                return False
+                # Remote path - stat the path itself (no parent listing)
+                item = self.stat(path, remote_config)
+                return item is not None and item.get('IsDir', False)
             else:
                 # Local path
                 return os.path.isdir(clean_path)
@@ -1444,6 +1820,7 @@ class RcloneWrapper:
         src_config: Optional[Dict],
         dst_config: Optional[Dict],
         copy_links: bool,
+        extra_args: Optional[List[str]] = None,
     ) -> int:
         """
         Internal method for copy/move/sync operations with rsync-like semantics
@@ -1636,6 +2013,9 @@ class RcloneWrapper:
         if copy_links:
             command.append('--copy-links')
 
+        if extra_args:
+            command.extend(extra_args)
+
         # Exclude .snapshot directories (NFS) - only for local sources
         if not src_remote_name and not src_config:
             if os.path.isdir(actual_src.rstrip('/')):
@@ -1734,9 +2114,35 @@ class RcloneWrapper:
     def job_exitstatus(self, job_id: int) -> int:
         return self._job_queue.get_exitstatus(job_id)
 
+    def job_status(self, job_id: int) -> Dict:
+        """
+        Get finished flag, exit status, percent, text and error text of a job at once
+
+        Returns:
+            dict with keys finished, exit_status, percent, text, error_text
+        """
+        return self._job_queue.get_status(job_id)
+
     def job_delete(self, job_id: int):
         self._job_queue.delete(job_id)
 
+    def job_generation(self) -> int:
+        """Counter that changes whenever a job starts or finishes"""
+        return self._job_queue.generation
+
+    def job_version(self, job_id: int) -> int:
+        """Counter that changes whenever a job's progress, text or state changes"""
+        return self._job_queue.get_version(job_id)
+
+    def wait_for_job_update(self, job_id: int, version: int, timeout: float) -> int:
+        """
+        Block until a job's state changes past version, or timeout seconds pass
+
+        Returns:
+            Current version (unchanged if the wait timed out)
+        """
+        return self._job_queue.wait_for_update(job_id, version, timeout)
+
     def get_running_jobs(self) -> List[int]:
         """Get list of currently running job IDs"""
         return self._job_queue.get_running_jobs()
@@ -1745,6 +2151,10 @@ class RcloneWrapper:
         """Shutdown gracefully, stopping all running jobs"""
         return self._job_queue.shutdown_all()
 
+    def stop_daemon(self):
+        """Stop the rclone rcd process"""
+        self._daemon.stop()
+
     def _format_credentials(self, config: Dict, name: str) -> Dict[str, str]:
         """
         Format remote config as rclone environment variables